@@ -0,0 +1,398 @@
+"""
+Benchmark suite for the task-manager CLI.
+
+Runs each benchmark, compares the best time against the stored JSON baseline
+and exits non-zero when any benchmark regresses by more than the threshold.
+
+    python benchmarks/bench.py                  # compare against baseline
+    python benchmarks/bench.py --update         # record a new baseline
+    python benchmarks/bench.py -k json --threshold 0.1
+"""
+
+import argparse
+import gc
+import importlib.util
+import io
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+ROOT = Path(__file__).resolve().parent
+SRC = ROOT.parent / "src"
+sys.path.insert(0, str(SRC))
+sys.path.insert(0, str(ROOT))
+
+from fixtures import H2MockServer, MockServer, h2, make_payload, make_tasks  # noqa: E402
+
+# The NumPy benchmarks are registered only where the optional `fast` extra is installed.
+HAVE_NUMPY = importlib.util.find_spec("numpy") is not None
+
+DEFAULT_BASELINE = ROOT / "baselines" / "baseline.json"
+BENCHMARKS: Dict[str, Callable[[], "Benchmark"]] = {}
+
+
+class Benchmark:
+    """A prepared benchmark: `run` is timed `repeat` times, `teardown` runs once."""
+
+    def __init__(self, run: Callable[[], object], repeat: int = 10,
+                 teardown: Optional[Callable[[], object]] = None):
+        self.run = run
+        self.repeat = repeat
+        self.teardown = teardown
+
+
+def benchmark(name: str):
+    def register(setup: Callable[[], Benchmark]):
+        BENCHMARKS[name] = setup
+        return setup
+    return register
+
+
+@benchmark("task_construct_10k")
+def _task_construct():
+    from task_manager_cli.models import Task
+    rows = make_tasks(10_000)
+    return Benchmark(lambda: [Task(row) for row in rows])
+
+
+@benchmark("task_read_timestamps_10k")
+def _task_read_timestamps():
+    # Construction plus the first read of the lazily parsed created_at/updated_at, as trends and next do.
+    from task_manager_cli.models import Task
+    rows = make_tasks(10_000)
+
+    def run():
+        for task in [Task(row) for row in rows]:
+            task.created_at, task.updated_at
+    return Benchmark(run)
+
+
+def _stats(vectorize: bool):
+    def setup():
+        from task_manager_cli.models import Task
+        from task_manager_cli.utils.stats import compute_stats
+        tasks = [Task(row) for row in make_tasks(10_000)]
+        now = time.time()
+        return Benchmark(lambda: compute_stats(tasks, now, vectorize=vectorize))
+    return setup
+
+
+BENCHMARKS["stats_stream_10k"] = _stats(False)
+if HAVE_NUMPY:
+    BENCHMARKS["stats_numpy_10k"] = _stats(True)
+
+
+@benchmark("trends_day_100k")
+def _trends():
+    from task_manager_cli.models import Task
+    from task_manager_cli.utils.trends import Bucket, compute_trends, trend_columns
+    tasks = [Task(row) for row in make_tasks(100_000)]
+    return Benchmark(lambda: compute_trends(trend_columns(tasks), Bucket.DAY), repeat=5)
+
+
+@benchmark("next_top10_100k")
+def _next_top10():
+    from task_manager_cli.models import Task
+    from task_manager_cli.utils.urgency import UrgencyWeights, most_urgent
+    tasks = [Task(row) for row in make_tasks(100_000)]
+    now = time.time()
+    return Benchmark(lambda: most_urgent(iter(tasks), 10, now, UrgencyWeights()), repeat=5)
+
+
+def _remove_snapshot(path: str):
+    import shutil
+    shutil.rmtree(os.path.dirname(path), ignore_errors=True)
+
+
+def _snapshot_file(count: int) -> str:
+    import tempfile
+    from task_manager_cli.utils.snapshot import write_snapshot
+    path = os.path.join(tempfile.mkdtemp(prefix="bench-snapshot-"), "snapshot.bin")
+    write_snapshot(path, make_tasks(count))
+    return path
+
+
+@benchmark("snapshot_open_100k")
+def _snapshot_open():
+    from task_manager_cli.utils.snapshot import Snapshot
+    path = _snapshot_file(100_000)
+    return Benchmark(lambda: len(Snapshot(path)), repeat=50, teardown=lambda: _remove_snapshot(path))
+
+
+@benchmark("snapshot_rows_100k")
+def _snapshot_rows():
+    from task_manager_cli.utils.snapshot import Snapshot
+    path = _snapshot_file(100_000)
+    return Benchmark(lambda: Snapshot(path).rows(), repeat=5, teardown=lambda: _remove_snapshot(path))
+
+
+@benchmark("snapshot_trends_100k")
+def _snapshot_trends():
+    from task_manager_cli.utils.snapshot import Snapshot
+    from task_manager_cli.utils.trends import Bucket, compute_trends, snapshot_trend_columns
+    path = _snapshot_file(100_000)
+    return Benchmark(lambda: compute_trends(snapshot_trend_columns(Snapshot(path)), Bucket.DAY), repeat=5,
+                     teardown=lambda: _remove_snapshot(path))
+
+
+if HAVE_NUMPY:
+    @benchmark("snapshot_stats_100k")
+    def _snapshot_stats():
+        from task_manager_cli.utils.snapshot import Snapshot
+        from task_manager_cli.utils.stats import snapshot_columns, vectorized_stats
+        path = _snapshot_file(100_000)
+        now = time.time()
+        return Benchmark(lambda: vectorized_stats(snapshot_columns(Snapshot(path)), now), repeat=20,
+                         teardown=lambda: _remove_snapshot(path))
+
+
+@benchmark("date_parse_10k")
+def _date_parse():
+    from task_manager_cli.models import Task
+    parse = Task._parse_date
+    values = [row["due_date"] for row in make_tasks(10_000)]
+    return Benchmark(lambda: [parse(None, value) for value in values])
+
+
+@benchmark("date_parse_cold_10k")
+def _date_parse_cold():
+    # The shared parser without its memo table: every value is parsed.
+    from task_manager_cli.utils.dates import _parse_iso
+    parse = _parse_iso.__wrapped__
+    values = [row["due_date"] for row in make_tasks(10_000)]
+    return Benchmark(lambda: [parse(value) for value in values])
+
+
+@benchmark("date_parse_legacy_10k")
+def _date_parse_legacy():
+    # The previous per-model path, for comparison: fromisoformat in a try/except.
+    from datetime import datetime
+
+    def parse(value):
+        if value:
+            try:
+                return datetime.fromisoformat(value)
+            except Exception:
+                return None
+        return None
+    values = [row["due_date"] for row in make_tasks(10_000)]
+    return Benchmark(lambda: [parse(value) for value in values])
+
+
+def _json_decode(count: int, repeat: int):
+    payload = make_payload(count)
+    return lambda: Benchmark(lambda: json.loads(payload), repeat=repeat)
+
+
+BENCHMARKS["json_decode_1k"] = _json_decode(1_000, 50)
+BENCHMARKS["json_decode_10k"] = _json_decode(10_000, 10)
+BENCHMARKS["json_decode_100k"] = _json_decode(100_000, 5)
+
+
+@benchmark("decode_columns_serial_100k")
+def _decode_columns_serial():
+    # One worker's job run in-process: the baseline the process pool divides up.
+    from task_manager_cli.utils.parallel import _decode_segment
+    payload = make_payload(100_000)
+    return Benchmark(lambda: _decode_segment(payload), repeat=3)
+
+
+if (os.cpu_count() or 1) > 1:
+    @benchmark("decode_columns_parallel_100k")
+    def _decode_columns_parallel():
+        from task_manager_cli.utils.parallel import default_workers, parallel_decode
+        payload = make_payload(100_000)
+        return Benchmark(lambda: parallel_decode(payload, default_workers()), repeat=3)
+
+
+@benchmark("list_render_1k")
+def _list_render():
+    from rich.console import Console
+    from task_manager_cli.commands.tasks import task_table
+    from task_manager_cli.models import Task
+    tasks = [Task(row) for row in make_tasks(1_000)]
+
+    def run():
+        Console(file=io.StringIO(), width=120).print(task_table(tasks))
+    return Benchmark(run, repeat=5)
+
+
+@benchmark("request_overhead")
+def _request_overhead():
+    from task_manager_cli.utils.api import APIClient
+    server = MockServer(task_count=1).__enter__()
+    client = APIClient()
+    client.base_url = server.base_url
+    client.limiter = None  # measure transport overhead, not the client-side rate limit
+
+    def run():
+        # memo=False: an in-process memo hit would skip the request being measured.
+        for _ in range(20):
+            client.request("GET", "/tasks/1", memo=False)
+    return Benchmark(run, repeat=10, teardown=lambda: server.__exit__(None, None, None))
+
+
+def _bulk_toggle(server_cls, adapter: Callable[[], object]):
+    # 100 toggles, 16 at a time, against a backend that takes 10 ms per request.
+    def setup():
+        from task_manager_cli.utils.api import APIClient
+        from task_manager_cli.utils.bulk import run_bulk
+        server = server_cls(task_count=1, latency=0.01).__enter__()
+        client = APIClient()
+        client.base_url = server.base_url
+        client.limiter = None
+        client.cache = None
+        client.session.mount("http://", adapter())
+
+        def run():
+            results = run_bulk(range(1, 101), lambda i: client.request("POST", f"/tasks/{i}/toggle",
+                                                                       {"completed": True}), concurrency=16)
+            assert all(result.error is None for result in results)
+
+        def teardown():
+            client.session.close()
+            server.__exit__(None, None, None)
+        return Benchmark(run, repeat=5, teardown=teardown)
+    return setup
+
+
+def _http1_adapter():
+    from task_manager_cli.utils.transport import TracingAdapter
+    return TracingAdapter()
+
+
+def _http2_adapter():
+    from task_manager_cli.utils.transport import HTTP2Adapter
+    return HTTP2Adapter(prior_knowledge=True)
+
+
+BENCHMARKS["bulk_toggle_http1_100"] = _bulk_toggle(MockServer, _http1_adapter)
+if h2 is not None:
+    BENCHMARKS["bulk_toggle_http2_100"] = _bulk_toggle(H2MockServer, _http2_adapter)
+
+
+def _roundtrip(unix: bool):
+    # 200 sequential POSTs (never memoized) over loopback TCP or a Unix socket.
+    def setup():
+        import tempfile
+        from task_manager_cli.utils.api import APIClient
+        directory = tempfile.mkdtemp(prefix="bench-socket-")
+        server = MockServer(task_count=1, unix_socket=os.path.join(directory, "api.sock") if unix else None)
+        server.__enter__()
+        client = APIClient()
+        client.base_url = server.base_url
+        client.limiter = None
+        client.cache = None
+
+        def run():
+            for i in range(1, 201):
+                client.request("POST", f"/tasks/{i}/toggle", {"completed": True})
+
+        def teardown():
+            client.session.close()
+            server.__exit__(None, None, None)
+            os.rmdir(directory)
+        return Benchmark(run, repeat=5, teardown=teardown)
+    return setup
+
+
+BENCHMARKS["request_roundtrip_tcp_200"] = _roundtrip(False)
+BENCHMARKS["request_roundtrip_unix_200"] = _roundtrip(True)
+
+
+@benchmark("cli_cold_start")
+def _cold_start():
+    env = dict(os.environ, PYTHONPATH=str(SRC))
+    command = [sys.executable, "-m", "task_manager_cli.cli", "version"]
+
+    def run():
+        subprocess.run(command, env=env, check=True, stdout=subprocess.DEVNULL)
+    return Benchmark(run, repeat=5)
+
+
+def measure(bench: Benchmark) -> Dict[str, float]:
+    bench.run()  # warm-up
+    samples: List[float] = []
+    # Like timeit, keep collector pauses out of the samples.
+    gc.disable()
+    try:
+        for _ in range(bench.repeat):
+            start = time.perf_counter()
+            bench.run()
+            samples.append(time.perf_counter() - start)
+            gc.collect()
+    finally:
+        gc.enable()
+        if bench.teardown:
+            bench.teardown()
+    return {"median": statistics.median(samples), "min": min(samples), "runs": len(samples)}
+
+
+def load_baseline(path: Path) -> Dict[str, Dict[str, float]]:
+    if not path.exists():
+        return {}
+    with open(path, "r") as f:
+        return json.load(f).get("results", {})
+
+
+def save_baseline(path: Path, results: Dict[str, Dict[str, float]]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    data = {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "results": results,
+    }
+    with open(path, "w") as f:
+        json.dump(data, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("-k", dest="pattern", help="Only run benchmarks whose name contains PATTERN")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE, help="Baseline JSON file")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="Allowed slowdown before failing, as a fraction (default: 0.25)")
+    parser.add_argument("--update", action="store_true", help="Write results as the new baseline")
+    parser.add_argument("--output", type=Path, help="Also write this run's results to a JSON file")
+    args = parser.parse_args(argv)
+
+    baseline = load_baseline(args.baseline)
+    results: Dict[str, Dict[str, float]] = {}
+    regressions = []
+    for name, setup in BENCHMARKS.items():
+        if args.pattern and args.pattern not in name:
+            continue
+        result = results[name] = measure(setup())
+        line = f"{name:<26} median {result['median'] * 1000:10.3f} ms   min {result['min'] * 1000:10.3f} ms"
+        previous = baseline.get(name)
+        if previous:
+            # Best-of timings are far less sensitive to scheduler noise than medians.
+            change = result["min"] / previous["min"] - 1
+            line += f"   {change:+7.1%} vs baseline"
+            if change > args.threshold:
+                line += "  REGRESSION"
+                regressions.append(name)
+        print(line)
+
+    if args.output:
+        save_baseline(args.output, results)
+    if args.update:
+        merged = dict(baseline, **results)
+        save_baseline(args.baseline, merged)
+        print(f"Baseline written to {args.baseline}")
+        return 0
+    if regressions:
+        print(f"{len(regressions)} benchmark(s) regressed more than {args.threshold:.0%}: {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
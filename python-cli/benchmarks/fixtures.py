@@ -0,0 +1,253 @@
+"""
+Payload generators and local mock API servers (HTTP/1.1 and HTTP/2) for the benchmark suite.
+"""
+
+import json
+import os
+import socket
+import socketserver
+import threading
+import time
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import quote
+
+try:
+    import h2.config
+    import h2.connection
+    import h2.events
+except ImportError:
+    h2 = None  # type: ignore
+
+STATUSES = ["pending", "in-progress", "completed"]
+PRIORITIES = ["LOW", "MEDIUM", "HIGH"]
+EPOCH = datetime(2024, 1, 1, 9, 0, 0)
+
+
+def _timestamp(value: datetime) -> str:
+    # Same shape as the Node backend: millisecond precision with a Z suffix.
+    return value.strftime("%Y-%m-%dT%H:%M:%S.") + f"{value.microsecond // 1000:03d}Z"
+
+
+def make_task(i: int) -> Dict[str, Any]:
+    """Build one task payload as returned by `GET /tasks`."""
+    created = EPOCH + timedelta(hours=i % 20000, milliseconds=i % 1000)
+    return {
+        "id": i,
+        "title": f"Task {i}",
+        "description": f"Description for task {i}" if i % 3 else None,
+        "status": STATUSES[i % len(STATUSES)],
+        "due_date": _timestamp(EPOCH + timedelta(days=i % 365)),
+        "priority": PRIORITIES[i % len(PRIORITIES)],
+        "completed": i % 3 == 2,
+        "user_id": 1 + i % 7,
+        "category_id": 1 + i % 12,
+        "created_at": _timestamp(created),
+        "updated_at": _timestamp(created + timedelta(minutes=i % 90)),
+    }
+
+
+def make_tasks(count: int) -> List[Dict[str, Any]]:
+    return [make_task(i) for i in range(1, count + 1)]
+
+
+def make_payload(count: int) -> bytes:
+    """Serialize `count` tasks to the JSON body the backend would send."""
+    return json.dumps(make_tasks(count)).encode("utf-8")
+
+
+def _route(tasks_body: bytes, method: str, path: str) -> Tuple[int, bytes]:
+    """Status and body for the routes both mock servers answer."""
+    if method == "GET" and path == "/tasks":
+        return 200, tasks_body
+    parts = path.strip("/").split("/")
+    if len(parts) >= 2 and parts[0] == "tasks" and parts[1].isdigit():
+        task_id = int(parts[1])
+        if method == "GET" and len(parts) == 2:
+            return 200, json.dumps(make_task(task_id)).encode("utf-8")
+        if method == "POST" and parts[2:] == ["toggle"]:
+            return 200, json.dumps({"message": f"Task {task_id} updated"}).encode("utf-8")
+    return 404, b'{"message": "Not found"}'
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Headers and body are written separately; without this, Nagle and delayed ACKs stall each POST by 40 ms.
+    disable_nagle_algorithm = True
+
+    def _reply(self):
+        server = self.server
+        length = int(self.headers.get("Content-Length") or 0)
+        if length:
+            self.rfile.read(length)
+        server.log.append((self.command, self.path, dict(self.headers)))
+        if server.latency:
+            time.sleep(server.latency)
+        headers: Dict[str, str] = {}
+        try:
+            status, headers, body = server.script.pop(0)
+        except IndexError:
+            status, body = _route(server.tasks_body, self.command, self.path)
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    do_GET = _reply
+    do_POST = _reply
+
+    def log_message(self, format, *args):
+        pass
+
+
+class _UnixHandler(_Handler):
+    disable_nagle_algorithm = False  # TCP_NODELAY does not apply to Unix sockets
+
+
+class _UnixHTTPServer(socketserver.ThreadingUnixStreamServer):
+    def get_request(self):
+        # BaseHTTPRequestHandler expects a (host, port) client address.
+        request, _ = super().get_request()
+        return request, ("local", 0)
+
+
+class MockServer:
+    """Serve generated tasks on a loopback port, or a Unix socket, in a background thread.
+
+    `latency` is slept before each response, standing in for backend work.
+    Responses queued on `script` as (status, headers, body) are sent first, in
+    order, whatever the request; `log` records each request's method, path and
+    headers.
+    """
+
+    def __init__(self, task_count: int = 1000, latency: float = 0.0, unix_socket: Optional[str] = None):
+        self.unix_socket = unix_socket
+        if unix_socket:
+            self.httpd = _UnixHTTPServer(unix_socket, _UnixHandler)
+        else:
+            self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        self.httpd.daemon_threads = True
+        self.httpd.tasks_body = make_payload(task_count)
+        self.httpd.latency = latency
+        self.script: List[Tuple[int, Dict[str, str], bytes]] = []
+        self.log: List[Tuple[str, str, Dict[str, str]]] = []
+        self.httpd.script = self.script
+        self.httpd.log = self.log
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.connections = 0
+        handle = self.httpd.process_request
+
+        def count(request, address):
+            self.connections += 1
+            handle(request, address)
+        self.httpd.process_request = count
+
+    @property
+    def base_url(self) -> str:
+        if self.unix_socket:
+            return "http+unix://" + quote(self.unix_socket, safe="")
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def __enter__(self) -> "MockServer":
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        if self.unix_socket and os.path.exists(self.unix_socket):
+            os.unlink(self.unix_socket)
+
+
+class H2MockServer:
+    """The MockServer routes over cleartext HTTP/2 (prior knowledge), using the h2 package.
+
+    Streams on one connection are answered concurrently, so a client that
+    multiplexes needs a single socket. `connections` counts accepted sockets.
+    """
+
+    def __init__(self, task_count: int = 1000, latency: float = 0.0):
+        if h2 is None:
+            raise RuntimeError("H2MockServer needs h2: pip install 'httpx[http2]'")
+        self.sock = socket.create_server(("127.0.0.1", 0))
+        self.tasks_body = make_payload(task_count)
+        self.latency = latency
+        self.connections = 0
+        self.thread = threading.Thread(target=self._accept, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.sock.getsockname()[:2]
+        return f"http://{host}:{port}"
+
+    def __enter__(self) -> "H2MockServer":
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.sock.close()
+
+    def _accept(self):
+        while True:
+            try:
+                conn, _ = self.sock.accept()
+            except OSError:
+                return
+            self.connections += 1
+            threading.Thread(target=self._serve, args=(conn,), daemon=True).start()
+
+    def _serve(self, conn: socket.socket):
+        h2conn = h2.connection.H2Connection(h2.config.H2Configuration(client_side=False, header_encoding="utf-8"))
+        # Guards h2conn; responders wait on it for flow-control window updates.
+        ready = threading.Condition()
+        with ready:
+            h2conn.initiate_connection()
+            conn.sendall(h2conn.data_to_send())
+        pending: Dict[int, Dict[str, str]] = {}
+        with conn:
+            while True:
+                try:
+                    data = conn.recv(65536)
+                except OSError:
+                    return
+                if not data:
+                    return
+                with ready:
+                    for event in h2conn.receive_data(data):
+                        if isinstance(event, h2.events.RequestReceived):
+                            pending[event.stream_id] = dict(event.headers)
+                        elif isinstance(event, h2.events.DataReceived):
+                            h2conn.acknowledge_received_data(event.flow_controlled_length, event.stream_id)
+                        elif isinstance(event, h2.events.StreamEnded):
+                            threading.Thread(target=self._respond, daemon=True, args=(
+                                conn, h2conn, ready, event.stream_id, pending.pop(event.stream_id))).start()
+                        elif isinstance(event, h2.events.WindowUpdated):
+                            ready.notify_all()
+                    conn.sendall(h2conn.data_to_send())
+
+    def _respond(self, conn: socket.socket, h2conn, ready: threading.Condition, stream_id: int,
+                 headers: Dict[str, str]):
+        if self.latency:
+            time.sleep(self.latency)
+        status, body = _route(self.tasks_body, headers[":method"], headers[":path"])
+        try:
+            with ready:
+                h2conn.send_headers(stream_id, [(":status", str(status)), ("content-type", "application/json"),
+                                                ("content-length", str(len(body)))])
+                while True:
+                    window = min(h2conn.local_flow_control_window(stream_id), h2conn.max_outbound_frame_size)
+                    if window <= 0:
+                        ready.wait()
+                        continue
+                    chunk, body = body[:window], body[window:]
+                    h2conn.send_data(stream_id, chunk, end_stream=not body)
+                    conn.sendall(h2conn.data_to_send())
+                    if not body:
+                        return
+        except OSError:
+            pass
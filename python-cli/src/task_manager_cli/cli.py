@@ -6,12 +6,35 @@ Main entry point for the CLI application.
 
 
 import typer
-from .commands import auth, tasks
+from typing import Optional
+from rich.console import Console
+from .commands import auth, categories, sync, tasks
+from .utils.config import ConfigError
+from .utils.profiler import Profiler, ProfileMode
+from .utils.trace import tracer
 
 app = typer.Typer(help="Task Manager CLI - Manage your tasks from the command line.")
 
+@app.callback()
+def main_options(
+    ctx: typer.Context,
+    trace: bool = typer.Option(False, "--trace", help="Print a timing waterfall of API requests after the command"),
+    profile: Optional[ProfileMode] = typer.Option(None, "--profile", help="Profile the command: cpu (cProfile) or alloc (tracemalloc)"),
+    profile_output: Optional[str] = typer.Option(None, "--profile-output", help="Write collapsed stacks for flamegraph tools to this file")
+):
+    """Task Manager CLI - Manage your tasks from the command line."""
+    if trace:
+        tracer.enabled = True
+        ctx.call_on_close(lambda: tracer.print_waterfall(Console(stderr=True)))
+    if profile is not None:
+        profiler = Profiler(profile, profile_output)
+        profiler.start()
+        ctx.call_on_close(lambda: profiler.stop(Console(stderr=True)))
+
 app.add_typer(auth.app, name="auth")
 app.add_typer(tasks.app, name="tasks")
+app.add_typer(categories.app, name="categories")
+app.command(name="sync")(sync.sync)
 
 @app.command()
 def version():
@@ -20,7 +43,11 @@ def version():
 
 
 def main():
-    app()
+    try:
+        app()
+    except ConfigError as e:
+        Console(stderr=True).print(f"[bold red]Configuration error:[/bold red] {e}")
+        raise SystemExit(1)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,127 @@
+import typer
+from typing import Optional
+from rich.color import Color, ColorParseError
+from rich.console import Console
+from rich.table import Table
+from rich.panel import Panel
+from task_manager_cli.utils.api import api_client
+from task_manager_cli.utils.category_index import category_index
+from task_manager_cli.models import Category
+
+console = Console()
+app = typer.Typer()
+
+def color_style(color: Optional[str]) -> Optional[str]:
+    """Rich style for a category's hex colour, or None if it cannot be used."""
+    if not color:
+        return None
+    if len(color) == 4 and color.startswith("#"):
+        color = "#" + "".join(c * 2 for c in color[1:])
+    try:
+        Color.parse(color)
+    except ColorParseError:
+        return None
+    return color
+
+def _swatch(color: str) -> str:
+    style = color_style(color)
+    return f"[{style}]■[/{style}] {color}" if style else (color or "-")
+
+@app.command()
+def list():
+    """List all categories"""
+    try:
+        response = api_client.request("GET", "/categories")
+        category_index.update(response)
+        if not response:
+            console.print("[yellow]No categories found.[/yellow]")
+            return
+        categories = [Category(category_data) for category_data in response]
+        table = Table(title="[bold cyan]Categories[/bold cyan]")
+        table.add_column("ID", style="bold")
+        table.add_column("Name", style="bold magenta")
+        table.add_column("Description")
+        table.add_column("Color")
+        for category in categories:
+            table.add_row(
+                str(category.id),
+                category.name,
+                category.description or "-",
+                _swatch(category.color)
+            )
+        console.print(table)
+    except Exception as e:
+        console.print(f"[bold red]Failed to list categories:[/bold red] {e}")
+
+@app.command()
+def show(category: str = typer.Argument(..., help="Category ID or name")):
+    """Show details for a category"""
+    try:
+        category_id = category_index.resolve(category)
+        response = api_client.request("GET", f"/categories/{category_id}")
+        category = Category(response)
+        panel = Panel(
+            f"[bold]Name:[/bold] {category.name}\n"
+            f"[bold]Description:[/bold] {category.description or '-'}\n"
+            f"[bold]Color:[/bold] {_swatch(category.color)}\n"
+            f"[bold]Created At:[/bold] {category.created_at.strftime('%Y-%m-%d %H:%M:%S') if category.created_at else '-'}\n"
+            f"[bold]Updated At:[/bold] {category.updated_at.strftime('%Y-%m-%d %H:%M:%S') if category.updated_at else '-'}",
+            title=f"[bold cyan]Category {category.id}[/bold cyan]", expand=False
+        )
+        console.print(panel)
+    except Exception as e:
+        console.print(f"[bold red]Failed to show category:[/bold red] {e}")
+
+@app.command()
+def create(
+    name: str = typer.Argument(..., help="Category name"),
+    description: str = typer.Argument(..., help="Category description"),
+    color: Optional[str] = typer.Option(None, help="Hex colour, e.g. #FF8800")
+):
+    """Create a new category"""
+    try:
+        category_data = {"name": name, "description": description}
+        if color is not None:
+            category_data["color"] = color
+        api_client.request("POST", "/categories", category_data)
+        category_index.clear()
+        console.print(f"[bold green]Category created:[/bold green] {name}")
+    except Exception as e:
+        console.print(f"[bold red]Failed to create category:[/bold red] {e}")
+
+@app.command()
+def update(
+    category: str = typer.Argument(..., help="Category ID or name"),
+    name: Optional[str] = typer.Option(None, help="Category name"),
+    description: Optional[str] = typer.Option(None, help="Category description"),
+    color: Optional[str] = typer.Option(None, help="Hex colour, e.g. #FF8800")
+):
+    """Update a category"""
+    try:
+        category_data = {}
+        if name is not None:
+            category_data["name"] = name
+        if description is not None:
+            category_data["description"] = description
+        if color is not None:
+            category_data["color"] = color
+        if not category_data:
+            console.print("[bold yellow]No fields to update.[/bold yellow]")
+            raise typer.Exit(code=1)
+        category_id = category_index.resolve(category)
+        api_client.request("PUT", f"/categories/{category_id}", category_data)
+        category_index.clear()
+        console.print(f"[bold green]Category updated with ID:[/bold green] {category_id}")
+    except Exception as e:
+        console.print(f"[bold red]Failed to update category:[/bold red] {e}")
+
+@app.command()
+def delete(category: str = typer.Argument(..., help="Category ID or name")):
+    """Delete a category"""
+    try:
+        category_id = category_index.resolve(category)
+        api_client.request("DELETE", f"/categories/{category_id}")
+        category_index.clear()
+        console.print(f"[bold green]Category deleted with ID:[/bold green] {category_id}")
+    except Exception as e:
+        console.print(f"[bold red]Failed to delete category:[/bold red] {e}")
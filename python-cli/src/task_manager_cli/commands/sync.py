@@ -0,0 +1,44 @@
+import typer
+from rich.console import Console
+from rich.panel import Panel
+from task_manager_cli.utils.config import config
+from task_manager_cli.utils.sync import sync_engine
+
+console = Console()
+
+def sync(
+    status: bool = typer.Option(False, "--status", help="Show the local store and the last sync instead of syncing"),
+    full: bool = typer.Option(False, "--full", help="Fetch every task and reconcile deletions")
+):
+    """Sync tasks into the local store, fetching only what changed"""
+    try:
+        if status:
+            info = sync_engine.status()
+            last = info["last_sync"]
+            lines = [
+                f"[bold]Profile:[/bold] {config.API_PROFILE}",
+                f"[bold]Store:[/bold] {info['path']}",
+                f"[bold]Snapshot:[/bold] {info['snapshot'] or '-'}",
+                f"[bold]Base URL:[/bold] {info['base_url'] or '-'}",
+                f"[bold]Tasks:[/bold] {info['total']}",
+                f"[bold]Watermark:[/bold] {info['watermark'] or '-'}",
+            ]
+            if last:
+                lines += [
+                    f"[bold]Last Sync:[/bold] {last['synced_at']} ({last['mode']}, {last['duration_ms']:.1f} ms)",
+                    f"[bold]Changes:[/bold] [green]+{last['added']}[/green] "
+                    f"[yellow]~{last['changed']}[/yellow] [red]-{last['removed']}[/red] "
+                    f"of {last['fetched']} fetched",
+                ]
+            else:
+                lines.append("[bold]Last Sync:[/bold] never")
+            console.print(Panel("\n".join(lines), title="[bold cyan]Sync Status[/bold cyan]", expand=False))
+            return
+        stats = sync_engine.sync(full=full)
+        console.print(
+            f"[bold green]Synced {stats['total']} tasks[/bold green] ({stats['mode']}): "
+            f"[green]+{stats['added']}[/green] [yellow]~{stats['changed']}[/yellow] "
+            f"[red]-{stats['removed']}[/red] in {stats['duration_ms']:.1f} ms"
+        )
+    except Exception as e:
+        console.print(f"[bold red]Failed to sync tasks:[/bold red] {e}")
@@ -1,11 +1,31 @@
+import json
+import sys
+import time
+import uuid
 import typer
-from datetime import datetime
-from typing import Optional
+from datetime import date, datetime, timedelta
+from itertools import groupby
+from typing import Any, Dict, List, Optional, Tuple
 from rich.console import Console
+from rich.live import Live
 from rich.table import Table
 from rich.panel import Panel
-from task_manager_cli.utils.api import api_client
-from task_manager_cli.models import Task, Priority
+from task_manager_cli.commands.categories import color_style
+from task_manager_cli.utils.api import APIError, api_client
+from task_manager_cli.utils.bulk import run_bulk
+from task_manager_cli.utils.category_index import category_index
+from task_manager_cli.utils.config import config
+from task_manager_cli.utils.diff import diff_versions, versions
+from task_manager_cli.utils.due_index import DueIndex
+from task_manager_cli.utils.parallel import TaskColumns
+from task_manager_cli.utils.routes import missing_routes
+from task_manager_cli.utils.snapshot import Snapshot
+from task_manager_cli.utils.stats import DEFAULT_HORIZONS, compute_stats, have_numpy, snapshot_columns, vectorized_stats
+from task_manager_cli.utils.sync import sync_engine
+from task_manager_cli.utils.urgency import most_urgent, urgency_weights
+from task_manager_cli.utils.trends import Bucket, compute_trends, snapshot_trend_columns, trend_columns, write_csv
+from task_manager_cli.utils.trace import tracer
+from task_manager_cli.models import Category, Task, Priority
 
 console = Console()
 app = typer.Typer()
@@ -13,7 +33,7 @@ app = typer.Typer()
 @app.command()
 def create(
     title: str = typer.Argument(..., help="Task title"),
-    category_id: int = typer.Argument(..., help="Category ID"),
+    category: str = typer.Argument(..., help="Category ID or name"),
     due_date: str = typer.Argument(..., help="Due date (YYYY-MM-DD)"),
     priority: Priority = typer.Option(Priority.MEDIUM, help="Task priority: LOW, MEDIUM, HIGH"),
     description: Optional[str] = typer.Option(None, help="Task description"),
@@ -26,6 +46,7 @@ def create(
         except ValueError:
             console.print("[bold red]Invalid due date format. Use YYYY-MM-DD.[/bold red]")
             raise typer.Exit(code=1)
+        category_id = category_index.resolve(category)
         response = api_client.request("POST", "/tasks", {
             "title": title,
             "description": description,
@@ -35,36 +56,447 @@ def create(
             "category_id": category_id
         })
         task = Task(response)
+        if isinstance(task.id, int):
+            sync_engine.record(upserts=[response])
         console.print(f"[bold green]Task created with ID:[/bold green] {task.id}")
     except Exception as e:
         console.print(f"[bold red]Failed to create task:[/bold red] {e}")
 
+def categories_by_id() -> Dict[int, Category]:
+    """Fetch all categories in one request, keyed by id for in-memory joins."""
+    response = api_client.request("GET", "/categories")
+    category_index.update(response)
+    return {category.id: category for category in (Category(data) for data in response)}
+
+def category_labels(categories: Dict[int, Category]) -> Dict[int, Tuple[str, Optional[str]]]:
+    """Each category's display name and row style, resolved once per listing."""
+    return {category_id: (category.name, color_style(category.color))
+            for category_id, category in categories.items()}
+
+def new_task_table(with_category: bool = False) -> Table:
+    table = Table(title="[bold cyan]Tasks[/bold cyan]")
+    table.add_column("ID", style="bold")
+    table.add_column("Title", style="bold magenta")
+    table.add_column("Status", style="cyan")
+    table.add_column("Due Date", style="green")
+    table.add_column("Priority", style="yellow")
+    if with_category:
+        table.add_column("Category")
+    return table
+
+def task_row(task: Task, labels: Optional[Dict[int, Tuple[str, Optional[str]]]] = None) -> Tuple[List[str], Optional[str]]:
+    """Cells and row style for one task in `tasks list`."""
+    cells = [
+        str(task.id),
+        task.title,
+        task.status,
+        task.due_date.strftime("%Y-%m-%d") if task.due_date else "-",
+        str(task.priority)
+    ]
+    if labels is None:
+        return cells, None
+    name, style = labels.get(task.category_id, (str(task.category_id or "-"), None))
+    cells.append(name)
+    return cells, style
+
+def task_table(tasks, categories: Optional[Dict[int, Category]] = None) -> Table:
+    """Build the table rendered by `tasks list`, optionally joined to category names."""
+    labels = None if categories is None else category_labels(categories)
+    table = new_task_table(labels is not None)
+    for task in tasks:
+        cells, style = task_row(task, labels)
+        table.add_row(*cells, style=style)
+    return table
+
+def watch_tasks(interval: float, with_category: bool):
+    """Poll /tasks and redraw a live table when tasks are added, removed or changed."""
+    labels = category_labels(categories_by_id()) if with_category else None
+    rows: Dict[int, Tuple[List[str], Optional[str]]] = {}
+    known: Dict[int, object] = {}
+    order: List[int] = []
+    first = True
+    table = new_task_table(with_category)
+    with Live(table, console=console, auto_refresh=False) as live:
+        while True:
+            try:
+                # The memo would hand back the previous poll; the HTTP cache still revalidates cheaply.
+                response = api_client.request("GET", "/tasks", memo=False) or []
+                current = versions(response)
+                diff = diff_versions(known, current)
+                if diff or first:
+                    for task_data in response:
+                        task_id = task_data.get("id")
+                        if task_id in diff.added or task_id in diff.changed or task_id not in rows:
+                            rows[task_id] = task_row(Task(task_data), labels)
+                    for task_id in diff.removed:
+                        rows.pop(task_id, None)
+                    known = current
+                    order = [task_data.get("id") for task_data in response]
+                    table = new_task_table(with_category)
+                    for task_id in order:
+                        cells, style = rows[task_id]
+                        # Every task is new on the first poll; highlight only what later polls change.
+                        if not first and (task_id in diff.added or task_id in diff.changed):
+                            cells = [f"[reverse]{cells[0]}[/reverse]"] + cells[1:]
+                        table.add_row(*cells, style=style)
+                    if first:
+                        changes = f"loaded {datetime.now():%H:%M:%S}"
+                    else:
+                        changes = (
+                            f"last change {datetime.now():%H:%M:%S} · "
+                            f"[green]+{len(diff.added)}[/green] [yellow]~{len(diff.changed)}[/yellow] "
+                            f"[red]-{len(diff.removed)}[/red]"
+                        )
+                    table.caption = f"{len(order)} tasks · {changes} · every {interval:g}s · Ctrl+C to stop"
+                    live.update(table, refresh=True)
+                    first = False
+            except APIError as e:
+                table.caption = f"[red]Poll failed at {datetime.now():%H:%M:%S}: {e}[/red]"
+                live.update(table, refresh=True)
+            time.sleep(interval)
+
 @app.command()
-def list():
+def list(
+    with_category: bool = typer.Option(False, "--with-category", help="Show each task's category name, coloured by the category"),
+    watch: Optional[float] = typer.Option(None, "--watch", metavar="SECONDS", help="Keep polling every SECONDS and redraw when tasks change")
+):
     """List all tasks"""
     try:
-        response = api_client.request("GET", "/tasks")
+        if watch is not None:
+            watch_tasks(max(watch, 0.5), with_category)
+            return
+        response = sync_engine.task_rows()
         if not response:
             console.print("[yellow]No tasks found.[/yellow]")
             return
-        tasks = [Task(task_data) for task_data in response]
-        table = Table(title="[bold cyan]Tasks[/bold cyan]")
+        categories = categories_by_id() if with_category else None
+        with tracer.span("models"):
+            tasks = [Task(task_data) for task_data in response]
+        with tracer.span("render"):
+            console.print(task_table(tasks, categories))
+    except KeyboardInterrupt:
+        pass
+    except Exception as e:
+        console.print(f"[bold red]Failed to list tasks:[/bold red] {e}")
+
+def breakdown_table(title: str, column: str, counts: Dict[Any, int], total: int,
+                    labels: Optional[Dict[Any, str]] = None) -> Table:
+    """Counts and shares of `total` for one `tasks stats` breakdown."""
+    table = Table(title=f"[bold cyan]{title}[/bold cyan]", title_justify="left")
+    table.add_column(column, style="bold")
+    table.add_column("Tasks", justify="right")
+    table.add_column("Share", justify="right", style="green")
+    for key, count in counts.items():
+        label = labels.get(key, str(key)) if labels else ("-" if key is None else str(key))
+        table.add_row(label, str(count), f"{count / total:.1%}" if total else "-")
+    return table
+
+def task_source():
+    """The local Snapshot when synced, else the API's task list (TaskColumns if decoded in parallel)."""
+    snapshot = sync_engine.snapshot()
+    return snapshot if snapshot is not None else sync_engine.task_rows()
+
+@app.command()
+def stats(
+    days: List[int] = typer.Option([*DEFAULT_HORIZONS], "--days", help="Due-date horizon in days; repeat for more buckets"),
+    with_category: bool = typer.Option(False, "--with-category", help="Show category names instead of IDs"),
+    as_json: bool = typer.Option(False, "--json", help="Print the counts as JSON")
+):
+    """Show task counts by status, priority, category and due date"""
+    try:
+        source = task_source()
+        with tracer.span("models"):
+            if isinstance(source, (Snapshot, TaskColumns)) and have_numpy():
+                result = vectorized_stats(snapshot_columns(source), time.time(), days)
+            else:
+                rows = source.rows() if isinstance(source, Snapshot) else source
+                result = compute_stats((Task(task_data) for task_data in rows), time.time(), days)
+        if as_json:
+            console.print_json(json.dumps(result))
+            return
+        total = result["total"]
+        if not total:
+            console.print("[yellow]No tasks found.[/yellow]")
+            return
+        labels = None
+        if with_category:
+            labels = {category_id: category.name for category_id, category in categories_by_id().items()}
+        console.print(
+            f"[bold]{total}[/bold] tasks: [green]{result['completed']} completed[/green] "
+            f"({result['completed'] / total:.1%}), {result['open']} open, "
+            f"[red]{result['overdue']} overdue[/red]"
+        )
+        with tracer.span("render"):
+            console.print(breakdown_table("By status", "Status", result["status"], total))
+            console.print(breakdown_table("By priority", "Priority", result["priority"], total))
+            console.print(breakdown_table("By category", "Category", result["category"], total, labels))
+            console.print(breakdown_table("Open tasks by due date", "Due", result["due"], result["open"]))
+    except Exception as e:
+        console.print(f"[bold red]Failed to compute task stats:[/bold red] {e}")
+
+@app.command()
+def trends(
+    bucket: Bucket = typer.Option(Bucket.DAY, "--bucket", help="Bucket size: day or week"),
+    limit: int = typer.Option(30, "--limit", help="Show only the most recent buckets (0 for all)"),
+    csv_path: Optional[str] = typer.Option(None, "--csv", metavar="FILE", help="Write every bucket as CSV to FILE ('-' for stdout)")
+):
+    """Show created, completed and overdue tasks over time, with a burndown"""
+    try:
+        source = task_source()
+        with tracer.span("models"):
+            if isinstance(source, (Snapshot, TaskColumns)):
+                columns = snapshot_trend_columns(source)
+            else:
+                columns = trend_columns(Task(task_data) for task_data in source)
+            series = compute_trends(columns, bucket)
+        if csv_path == "-":
+            write_csv(series, sys.stdout)
+            return
+        if csv_path:
+            with open(csv_path, "w", newline="") as f:
+                write_csv(series, f)
+            console.print(f"[bold green]Wrote {len(series)} rows to[/bold green] {csv_path}")
+            return
+        if not series:
+            console.print("[yellow]No tasks found.[/yellow]")
+            return
+        shown = series[-limit:] if limit > 0 else series
+        peak = max(row.open for row in shown) or 1
+        table = Table(title=f"[bold cyan]Task trends by {bucket.value}[/bold cyan]")
+        table.add_column("Period", style="bold")
+        table.add_column("Created", justify="right", style="cyan")
+        table.add_column("Completed", justify="right", style="green")
+        table.add_column("Overdue", justify="right", style="red")
+        table.add_column("Open", justify="right")
+        table.add_column("Burndown", style="yellow", no_wrap=True)
+        for row in shown:
+            table.add_row(row.start.isoformat(), str(row.created), str(row.completed),
+                          str(row.overdue), str(row.open), "█" * round(20 * row.open / peak))
+        console.print(table)
+    except Exception as e:
+        console.print(f"[bold red]Failed to compute task trends:[/bold red] {e}")
+
+def agenda_table(title: str, tasks: List[Task], with_due: bool = False) -> Table:
+    table = Table(title=title, title_justify="left")
+    table.add_column("ID", style="bold")
+    table.add_column("Title", style="bold magenta")
+    if with_due:
+        table.add_column("Due Date", style="red")
+    table.add_column("Priority", style="yellow")
+    table.add_column("Status", style="cyan")
+    for task in tasks:
+        cells = [str(task.id), task.title]
+        if with_due:
+            cells.append(task.due_date.astimezone().strftime("%Y-%m-%d"))
+        table.add_row(*cells, str(task.priority), task.status)
+    return table
+
+def today_agenda(overdue: bool) -> Optional[Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]]:
+    """Today's due and overdue tasks from two small server-side queries, or None if the server lacks them.
+
+    A route the server answers with 404 or 405 is remembered for a day, so
+    later runs go straight to the full task list.
+    """
+    routes = ["/tasks/due/today"] + (["/tasks/overdue"] if overdue else [])
+    if any(missing_routes.missing(api_client.base_url, route) for route in routes):
+        return None
+    results = []
+    for route in routes:
+        try:
+            results.append(api_client.request("GET", route) or [])
+        except APIError as e:
+            # The Hono backend routes /tasks/overdue to /tasks/:id, which answers 404; the full list works everywhere.
+            if e.status_code in (404, 405):
+                missing_routes.add(api_client.base_url, route)
+            return None
+    due, late = results[0], results[1] if overdue else []
+    # /tasks/overdue also has tasks due earlier today, which are listed under today.
+    today_ids = {task.get("id") for task in due}
+    return due, [task for task in late if task.get("id") not in today_ids]
+
+@app.command()
+def agenda(
+    first: Optional[str] = typer.Option(None, "--from", help="First day, YYYY-MM-DD (default: today)"),
+    last: Optional[str] = typer.Option(None, "--to", help="Last day, inclusive, YYYY-MM-DD (default: --from)"),
+    overdue: bool = typer.Option(True, "--overdue/--no-overdue", help="Also list open tasks due before --from")
+):
+    """Show tasks due in a date range, grouped by day"""
+    try:
+        first_day = date.fromisoformat(first) if first else date.today()
+        last_day = date.fromisoformat(last) if last else first_day
+    except ValueError:
+        console.print("[bold red]Invalid date format. Use YYYY-MM-DD.[/bold red]")
+        raise typer.Exit(code=1)
+    if last_day < first_day:
+        console.print("[bold red]--to must not be before --from.[/bold red]")
+        raise typer.Exit(code=1)
+    try:
+        start = time.mktime(first_day.timetuple())
+        end = time.mktime((last_day + timedelta(days=1)).timetuple())
+        store = sync_engine.local_store()
+        today = None
+        if store is None and first_day == last_day == date.today():
+            today = today_agenda(overdue)
+        if store is not None:
+            due, late = store.due_between(start, end), store.overdue(start) if overdue else []
+        elif today is not None:
+            due, late = today
+        else:
+            index = DueIndex(api_client.request("GET", "/tasks") or [])
+            due, late = index.between(start, end), index.overdue(start) if overdue else []
+        with tracer.span("render"):
+            if late:
+                console.print(agenda_table("[bold red]Overdue[/bold red]", [Task(row) for row in late], with_due=True))
+            tasks = [Task(row) for row in due]
+            for day, group in groupby(tasks, key=lambda task: task.due_date.astimezone().date()):
+                console.print(agenda_table(f"[bold cyan]{day:%a %d %b %Y}[/bold cyan]", [*group]))
+            if not tasks:
+                period = first_day.isoformat() if first_day == last_day else f"{first_day} to {last_day}"
+                console.print(f"[yellow]Nothing due {'on' if first_day == last_day else 'from'} {period}.[/yellow]")
+    except Exception as e:
+        console.print(f"[bold red]Failed to show agenda:[/bold red] {e}")
+
+@app.command(name="next")
+def next_tasks(count: int = typer.Option(10, "-n", "--count", help="Number of tasks to show")):
+    """Show the most urgent open tasks"""
+    try:
+        store = sync_engine.local_store()
+        rows = store.iter_open() if store is not None else api_client.request("GET", "/tasks") or []
+        with tracer.span("models"):
+            ranked = most_urgent((Task(task_data) for task_data in rows), max(count, 0), time.time(), urgency_weights())
+        if not ranked:
+            console.print("[yellow]No open tasks.[/yellow]")
+            return
+        table = Table(title="[bold cyan]Next Tasks[/bold cyan]")
+        table.add_column("#", justify="right")
         table.add_column("ID", style="bold")
         table.add_column("Title", style="bold magenta")
-        table.add_column("Status", style="cyan")
         table.add_column("Due Date", style="green")
         table.add_column("Priority", style="yellow")
-        for task in tasks:
-            table.add_row(
-                str(task.id),
-                task.title,
-                task.status,
-                task.due_date.strftime("%Y-%m-%d") if task.due_date else "-",
-                str(task.priority)
-            )
+        table.add_column("Urgency", justify="right", style="red")
+        for rank, (score, task) in enumerate(ranked, 1):
+            table.add_row(str(rank), str(task.id), task.title,
+                          task.due_date.strftime("%Y-%m-%d") if task.due_date else "-",
+                          str(task.priority), f"{score:.2f}")
         console.print(table)
     except Exception as e:
-        console.print(f"[bold red]Failed to list tasks:[/bold red] {e}")
+        console.print(f"[bold red]Failed to rank tasks:[/bold red] {e}")
+
+def read_task_ids(values: List[str], read_stdin: bool) -> List[int]:
+    """Task IDs from arguments, separated by spaces or commas; "-" reads more from stdin."""
+    tokens = []
+    for value in values:
+        tokens.extend(sys.stdin.read().replace(",", " ").split() if value == "-" else value.replace(",", " ").split())
+    if read_stdin:
+        tokens.extend(sys.stdin.read().replace(",", " ").split())
+    invalid = [token for token in tokens if not token.isdigit()]
+    if invalid:
+        raise ValueError(f"Invalid task ID: {invalid[0]}")
+    return [*dict.fromkeys(int(token) for token in tokens)]
+
+def query_task_ids(rows: List[Dict[str, Any]], status: Optional[str], overdue: bool,
+                   category: Optional[str]) -> List[int]:
+    """IDs of tasks matching every given filter."""
+    category_id = category_index.resolve(category) if category is not None else None
+    now = time.time()
+    ids = []
+    for task in (Task(task_data) for task_data in rows):
+        if status is not None and task.status != status:
+            continue
+        if category_id is not None and task.category_id != category_id:
+            continue
+        if overdue and (task.completed or task.due_date is None or task.due_date.timestamp() >= now):
+            continue
+        ids.append(task.id)
+    return ids
+
+def completion_states(task_ids: List[int], rows: List[Dict[str, Any]]) -> Dict[int, bool]:
+    """Current completion of each task, from the synced store when there is one, else `rows` or GET /tasks."""
+    store = sync_engine.local_store()
+    if store is not None:
+        return store.completion(task_ids)
+    rows = rows or api_client.request("GET", "/tasks") or []
+    return {task_data.get("id"): bool(task_data.get("completed")) for task_data in rows}
+
+def set_completion(ids: List[str], completed: Optional[bool], status: Optional[str], overdue: bool,
+                   category: Optional[str], concurrency: Optional[int]) -> bool:
+    """Set (or, with completed=None, flip) completion of many tasks; returns False if any failed."""
+    if concurrency is None:
+        concurrency = config.setting("concurrency", 8, int)
+    query = status is not None or overdue or category is not None
+    task_ids = read_task_ids(ids, read_stdin=not ids and not query and not sys.stdin.isatty())
+    rows = sync_engine.task_rows() if query else []
+    if query:
+        task_ids = [*dict.fromkeys(task_ids + query_task_ids(rows, status, overdue, category))]
+    if not task_ids:
+        console.print("[yellow]No tasks selected.[/yellow]")
+        return True
+    states = completion_states(task_ids, rows) if completed is None else {}
+
+    def send(task_id: int) -> bool:
+        if completed is None and task_id not in states:
+            raise ValueError("Task not found")
+        value = (not states[task_id]) if completed is None else completed
+        # The body sets an absolute state, so a retried request cannot flip it twice.
+        api_client.request("POST", f"/tasks/{task_id}/toggle", {"completed": value},
+                           idempotency_key=str(uuid.uuid4()))
+        return value
+
+    results = run_bulk(task_ids, send, concurrency)
+    done = [result for result in results if result.error is None]
+    failed = [result for result in results if result.error is not None]
+    if done:
+        sync_engine.record(patches={result.item: {"completed": result.value} for result in done})
+    closed = sum(1 for result in done if result.value)
+    console.print(
+        f"[bold green]Updated {len(done)} of {len(results)} tasks:[/bold green] "
+        f"{closed} completed, {len(done) - closed} reopened"
+        + (f", [bold red]{len(failed)} failed[/bold red]" if failed else "")
+    )
+    if failed:
+        table = Table(title="[bold red]Failed[/bold red]", title_justify="left")
+        table.add_column("ID", style="bold")
+        table.add_column("Error")
+        for result in failed:
+            table.add_row(str(result.item), str(result.error))
+        console.print(table)
+    return not failed
+
+BULK_HELP = "Task IDs; '-' reads IDs from stdin (also read when no IDs or filters are given and stdin is piped)"
+
+@app.command()
+def toggle(
+    ids: Optional[List[str]] = typer.Argument(None, help=BULK_HELP),
+    status: Optional[str] = typer.Option(None, "--status", help="Also select tasks with this status"),
+    overdue: bool = typer.Option(False, "--overdue", help="Also select open tasks past their due date"),
+    category: Optional[str] = typer.Option(None, "--category", help="Also select tasks in this category (ID or name)"),
+    concurrency: Optional[int] = typer.Option(None, "--concurrency", "-j", help="Requests in flight at once (default: the concurrency setting, or 8)")
+):
+    """Flip completion of one or more tasks"""
+    try:
+        ok = set_completion(ids or [], None, status, overdue, category, concurrency)
+    except Exception as e:
+        console.print(f"[bold red]Failed to toggle tasks:[/bold red] {e}")
+        ok = False
+    if not ok:
+        raise typer.Exit(code=1)
+
+@app.command()
+def complete(
+    ids: Optional[List[str]] = typer.Argument(None, help=BULK_HELP),
+    status: Optional[str] = typer.Option(None, "--status", help="Also select tasks with this status"),
+    overdue: bool = typer.Option(False, "--overdue", help="Also select open tasks past their due date"),
+    category: Optional[str] = typer.Option(None, "--category", help="Also select tasks in this category (ID or name)"),
+    concurrency: Optional[int] = typer.Option(None, "--concurrency", "-j", help="Requests in flight at once (default: the concurrency setting, or 8)")
+):
+    """Mark one or more tasks as completed"""
+    try:
+        ok = set_completion(ids or [], True, status, overdue, category, concurrency)
+    except Exception as e:
+        console.print(f"[bold red]Failed to complete tasks:[/bold red] {e}")
+        ok = False
+    if not ok:
+        raise typer.Exit(code=1)
 
 @app.command()
 def show(task_id: int = typer.Argument(..., help="Task ID")):
@@ -95,7 +527,7 @@ def update(
     status: Optional[str] = typer.Option(None, help="Task status"),
     due_date: Optional[str] = typer.Option(None, help="Due date (YYYY-MM-DD)"),
     priority: Optional[Priority] = typer.Option(None, help="Task priority: LOW, MEDIUM, HIGH"),
-    category_id: Optional[int] = typer.Option(None, help="Category ID")
+    category: Optional[str] = typer.Option(None, "--category", "--category-id", help="Category ID or name")
 ):
     """Update a task"""
     try:
@@ -115,12 +547,16 @@ def update(
                 raise typer.Exit(code=1)
         if priority is not None:
             task_data["priority"] = priority.value
-        if category_id is not None:
-            task_data["category_id"] = category_id
+        if category is not None:
+            task_data["category_id"] = category_index.resolve(category)
         if not task_data:
             console.print("[bold yellow]No fields to update.[/bold yellow]")
             raise typer.Exit(code=1)
         response = api_client.request("PUT", f"/tasks/{task_id}", task_data)
+        if isinstance(response, dict) and response.get("id") == task_id:
+            sync_engine.record(upserts=[response])
+        else:
+            sync_engine.record(patches={task_id: task_data})
         console.print(f"[bold green]Task updated with ID:[/bold green] {task_id}")
     except Exception as e:
         console.print(f"[bold red]Failed to update task:[/bold red] {e}")
@@ -130,6 +566,7 @@ def delete(task_id: int = typer.Argument(..., help="Task ID")):
     """Delete a task"""
     try:
         api_client.request("DELETE", f"/tasks/{task_id}")
+        sync_engine.record(deletes=[task_id])
         console.print(f"[bold green]Task deleted with ID:[/bold green] {task_id}")
     except Exception as e:
         console.print(f"[bold red]Failed to delete task:[/bold red] {e}")
\ No newline at end of file
@@ -1,6 +1,8 @@
-from typing import Optional
+import threading
 from datetime import datetime
+from typing import Dict, Iterable, List, Optional
 from enum import Enum
+from .utils.dates import parse_timestamp
 
 class Priority(str, Enum):
     LOW = "LOW"
@@ -13,6 +15,38 @@ class Role(str, Enum):
     SUPERADMIN = "superadmin"
     DISABLED = "disabled"
 
+class CodeTable:
+    """Interns strings as small integer codes shared by every model object.
+
+    Codes are assigned in first-seen order after the initial values, so the
+    initial values define the sort order of the known ones.
+    """
+
+    def __init__(self, initial: Iterable[str] = ()):
+        self.values: List[str] = []
+        self.codes: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        for value in initial:
+            self.code(value)
+
+    def code(self, value) -> int:
+        if isinstance(value, Enum):
+            value = value.value
+        code = self.codes.get(value)
+        if code is None:
+            with self._lock:
+                code = self.codes.get(value)
+                if code is None:
+                    code = self.codes[value] = len(self.values)
+                    self.values.append(value)
+        return code
+
+    def value(self, code: int) -> str:
+        return self.values[code]
+
+STATUS_CODES = CodeTable(["pending", "in-progress", "completed"])
+PRIORITY_CODES = CodeTable([p.value for p in Priority])
+
 class User:
     def __init__(self, data: dict):
         self.id = data.get("id")
@@ -24,12 +58,7 @@ class User:
         self.updated_at = self._parse_date(data.get("updated_at"))
 
     def _parse_date(self, value):
-        if value:
-            try:
-                return datetime.fromisoformat(value)
-            except Exception:
-                return None
-        return None
+        return parse_timestamp(value)
 
 class Category:
     def __init__(self, data: dict):
@@ -42,31 +71,64 @@ class Category:
         self.updated_at = self._parse_date(data.get("updated_at"))
 
     def _parse_date(self, value):
-        if value:
-            try:
-                return datetime.fromisoformat(value)
-            except Exception:
-                return None
-        return None
+        return parse_timestamp(value)
 
 class Task:
+    # Status and priority are held as codes into STATUS_CODES and PRIORITY_CODES.
+    # created_at/updated_at hold the raw value until first read; listings never read them.
+    __slots__ = ("id", "title", "description", "status_code", "due_date", "priority_code",
+                 "completed", "user_id", "category_id", "_created_at", "_updated_at")
+
     def __init__(self, data: dict):
         self.id = data.get("id")
         self.title = data.get("title", "")
         self.description = data.get("description")
-        self.status = data.get("status", "pending")
+        self.status_code = STATUS_CODES.code(data.get("status", "pending"))
         self.due_date = self._parse_date(data.get("due_date"))
-        self.priority = data.get("priority", Priority.MEDIUM)
+        self.priority_code = PRIORITY_CODES.code(data.get("priority", Priority.MEDIUM))
         self.completed = data.get("completed", False)
         self.user_id = data.get("user_id")
         self.category_id = data.get("category_id")
-        self.created_at = self._parse_date(data.get("created_at"))
-        self.updated_at = self._parse_date(data.get("updated_at"))
+        self._created_at = data.get("created_at")
+        self._updated_at = data.get("updated_at")
+
+    @property
+    def created_at(self) -> Optional[datetime]:
+        value = self._created_at
+        if value is not None and value.__class__ is not datetime:
+            value = self._created_at = self._parse_date(value)
+        return value
+
+    @created_at.setter
+    def created_at(self, value):
+        self._created_at = value
+
+    @property
+    def updated_at(self) -> Optional[datetime]:
+        value = self._updated_at
+        if value is not None and value.__class__ is not datetime:
+            value = self._updated_at = self._parse_date(value)
+        return value
+
+    @updated_at.setter
+    def updated_at(self, value):
+        self._updated_at = value
+
+    @property
+    def status(self) -> str:
+        return STATUS_CODES.value(self.status_code)
+
+    @status.setter
+    def status(self, value: str):
+        self.status_code = STATUS_CODES.code(value)
+
+    @property
+    def priority(self) -> str:
+        return PRIORITY_CODES.value(self.priority_code)
+
+    @priority.setter
+    def priority(self, value: str):
+        self.priority_code = PRIORITY_CODES.code(value)
 
     def _parse_date(self, value):
-        if value:
-            try:
-                return datetime.fromisoformat(value)
-            except Exception:
-                return None
-        return None
\ No newline at end of file
+        return parse_timestamp(value)
@@ -3,56 +3,310 @@ API client for task-manager CLI
 This module provides a client for interacting with the task-manager API.
 """
 
+import gzip
+import json
+import os
+import time
 import requests
-from typing import Optional, Dict, Any
-from .config import config
+from functools import cached_property
+from urllib3.util.request import ACCEPT_ENCODING
+from typing import Optional, Dict, Any, List, Tuple
+from .breaker import OPEN, get_breaker
+from .cache import CacheEntry, ResponseCache
+from .config import as_bool, config
+from .memo import MISS, Memo
+from .parallel import decode_json, default_workers
+from .ratelimit import RateLimiter
+from .retry import TRANSIENT_STATUSES, RetryPolicy, parse_retry_after
+from .trace import RequestTrace, tracer
+from .transport import HTTP2Adapter, TracingAdapter, UnixSocketAdapter
 
 class APIError(Exception):
     """Custom exception for API errors."""
-    pass
+
+    def __init__(self, message: str, status_code: Optional[int] = None,
+                 retry_after: Optional[float] = None, transient: bool = False):
+        super().__init__(message)
+        self.status_code = status_code
+        self.retry_after = retry_after
+        self.transient = transient
 
 class APIClient:
+    """Client for the task-manager API.
+
+    Settings are read from the config on first use rather than in __init__, so
+    the module-level client can be created before the configuration is valid.
+    """
+
     def __init__(self):
         self.base_url = config.API_BASE_URL
-        self.timeout = config.API_TIMEOUT
         self.token = None
-    
+
+    @cached_property
+    def timeout(self) -> int:
+        return config.API_TIMEOUT
+
+    @cached_property
+    def connect_timeout(self) -> float:
+        return config.setting("connect_timeout", 5, float)
+
+    @cached_property
+    def retry(self) -> RetryPolicy:
+        return RetryPolicy(config.API_RETRIES, config.API_RETRY_BACKOFF, budget=config.API_RETRY_BUDGET)
+
+    @cached_property
+    def limiter(self) -> Optional[RateLimiter]:
+        # Without a configured rate the bucket starts unbounded and switches on when the server pushes back.
+        return RateLimiter(config.setting("rate_limit", 0, float) or None, config.setting("rate_burst", None, float),
+                           max_rate=config.setting("rate_limit_max", None, float))
+
+    @cached_property
+    def cache(self) -> Optional[ResponseCache]:
+        if not config.setting("cache", True, as_bool):
+            return None
+        return ResponseCache(
+            os.path.join(config.CONFIG_DIR, "http-cache"),
+            max_bytes=config.setting("cache_max_bytes", 50 * 1024 * 1024, int),
+            default_ttl=config.setting("cache_ttl", 0, float),
+            ttl_overrides=config.profile.get("cache_ttl_overrides"),
+        )
+
+    @cached_property
+    def memo(self) -> Memo:
+        return Memo(ttl=config.setting("memo_ttl", 10, float))
+
+    @cached_property
+    def decode_workers(self) -> int:
+        if not config.setting("parallel_decode", False, as_bool):
+            return 0
+        return config.setting("parallel_decode_workers", default_workers(), int)
+
+    @cached_property
+    def decode_min_bytes(self) -> int:
+        return config.setting("parallel_decode_min_bytes", 8 * 1024 * 1024, int)
+
+    @cached_property
+    def accept_encoding(self) -> str:
+        # urllib3 lists gzip and deflate, plus br and zstd when their modules are installed.
+        return ACCEPT_ENCODING if config.setting("compression", True, as_bool) else "identity"
+
+    @cached_property
+    def compress_min_bytes(self) -> int:
+        return config.setting("compress_min_bytes", 0, int)
+
+    @cached_property
+    def session(self) -> requests.Session:
+        session = requests.Session()
+        # API_BASE_URL=http+unix://%2Frun%2Ftask-api.sock talks to a co-located backend over a Unix socket.
+        session.mount("http+unix://", UnixSocketAdapter())
+        if config.setting("http2", False, as_bool):
+            # Cleartext HTTP/2 needs prior knowledge; https negotiates it with ALPN.
+            connections = config.setting("http2_max_connections", 10, int)
+            session.mount("http://", HTTP2Adapter(prior_knowledge=True, max_connections=connections))
+            session.mount("https://", HTTP2Adapter(max_connections=connections))
+            return session
+        adapter = TracingAdapter()
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
     def set_token(self, token: str):
         self.token = token
     
-    def _get_headers(self) -> Dict[str, str]:
-        headers = {"Content-Type": "application/json"}
+    def _get_headers(self, idempotency_key: Optional[str] = None) -> Dict[str, str]:
+        headers = {"Content-Type": "application/json", "Accept-Encoding": self.accept_encoding}
         if self.token:
             headers["Authorization"] = f"Bearer {self.token}"
+        if idempotency_key:
+            headers["Idempotency-Key"] = idempotency_key
         return headers
     
-    def request(self, method: str, endpoint: str, data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    def request(self, method: str, endpoint: str, data: Optional[Dict[str, Any]] = None,
+                idempotency_key: Optional[str] = None, memo: bool = True) -> Dict[str, Any]:
+        """Send a request and return the decoded JSON body.
+
+        GET results are memoized for the process and shared between callers, so
+        they must not be mutated; concurrent identical GETs share one request.
+        Pass memo=False to always go to the server (or its HTTP cache validators).
+        """
+        if method != "GET":
+            result = self._request(method, endpoint, data, idempotency_key)
+            self.memo.invalidate(f"{self.base_url}{path}" for path in _resource_paths(endpoint))
+            return result
+        if not memo:
+            return self._request(method, endpoint, data, idempotency_key)
+        key = (method, f"{self.base_url}{endpoint}", self.token)
+        result, how = self.memo.call(key, lambda: self._request(method, endpoint, data, idempotency_key))
+        if how != MISS and tracer.active:
+            trace = tracer.start(endpoint, method)
+            trace.extra["memo"] = how
+            tracer.finish(trace)
+        return result
+
+    def _request(self, method: str, endpoint: str, data: Optional[Dict[str, Any]],
+                 idempotency_key: Optional[str]) -> Any:
         url = f"{self.base_url}{endpoint}"
-        headers = self._get_headers()
+        headers = self._get_headers(idempotency_key)
+        trace = tracer.start(endpoint, method)
         try:
-            response = requests.request(
-                method,
-                url,
-                json=data,
-                headers=headers,
-                timeout=self.timeout
-            )
-            response.raise_for_status()
-            if response.status_code == 204:
+            cached = None
+            if method == "GET" and self.cache is not None:
+                with trace.phase("cache"):
+                    cached = self.cache.get(self.cache.key(url, self.token))
+                if cached is not None:
+                    if cached.is_fresh(self.cache.ttl(endpoint)):
+                        trace.extra["cache"] = "fresh"
+                        return self._decode(cached.body, trace)
+                    headers.update(cached.validators())
+            response = self._send_with_retry(method, url, data, headers, bool(idempotency_key), trace)
+            body = response.content
+            if self.cache is not None:
+                with trace.phase("cache"):
+                    body = self._update_cache(method, endpoint, url, response, cached, trace)
+            if response.status_code == 204 or not body:
                 return {}
-            return response.json()
+            return self._decode(body, trace)
+        except APIError as e:
+            trace.error = str(e)
+            raise
+        finally:
+            tracer.finish(trace)
+
+    def _decode(self, body: bytes, trace: RequestTrace) -> Any:
+        """The JSON body; large task arrays decode in parallel into TaskColumns when enabled."""
+        with trace.phase("decode"):
+            try:
+                return decode_json(body, self.decode_min_bytes, self.decode_workers)
+            except ValueError as e:
+                raise APIError(f"Invalid JSON in response: {e}")
+
+    def _compress(self, data: Optional[Dict[str, Any]]) -> Tuple[Optional[bytes], int]:
+        """A gzipped JSON body for `data` and the bytes it saves, or (None, 0) to send it as is.
+
+        Bodies are compressed only from API_COMPRESS_MIN_BYTES up, and only when that makes them smaller.
+        """
+        if data is None or self.compress_min_bytes <= 0:
+            return None, 0
+        body = json.dumps(data, allow_nan=False).encode("utf-8")
+        if len(body) < self.compress_min_bytes:
+            return None, 0
+        compressed = gzip.compress(body, mtime=0)
+        if len(compressed) >= len(body):
+            return None, 0
+        return compressed, len(body) - len(compressed)
+
+    def _update_cache(self, method: str, endpoint: str, url: str, response: requests.Response,
+                      cached: Optional[CacheEntry], trace: RequestTrace) -> bytes:
+        """Serve a 304 from the cache, store cacheable bodies and drop entries a mutation made stale."""
+        if method != "GET":
+            for path in _resource_paths(endpoint):
+                self.cache.invalidate(self.cache.key(f"{self.base_url}{path}", self.token))
+            return response.content
+        if response.status_code == 304 and cached is not None:
+            self.cache.touch(cached)
+            trace.extra["cache"] = "revalidated"
+            return cached.body
+        if response.status_code == 200 and self.cache.store(self.cache.key(url, self.token), url,
+                                                            response.headers, response.content):
+            trace.extra["cache"] = "stored"
+        return response.content
+
+    def _send_with_retry(self, method: str, url: str, data: Optional[Dict[str, Any]], headers: Dict[str, str],
+                         idempotent: bool, trace: RequestTrace) -> requests.Response:
+        deadline = time.monotonic() + self.retry.budget
+        breaker = get_breaker(self.base_url, config.setting("breaker_threshold", 5, int),
+                              config.setting("breaker_reset", 30, float))
+        attempt = 0
+        while True:
+            if not breaker.allow():
+                trace.extra["circuit"] = OPEN
+                raise APIError(f"Backend at {self.base_url} is failing; not retrying for {breaker.retry_in:.0f}s.")
+            if self.limiter is not None:
+                start = time.perf_counter()
+                if self.limiter.acquire():
+                    trace.add_phase("throttle", start)
+            try:
+                result = self._send(method, url, data, headers, trace)
+                breaker.record_success()
+                trace.extra["circuit"] = breaker.state
+                return result
+            except APIError as e:
+                # A 429 or an ordinary 4xx/500 still proves the backend is up.
+                if e.transient and e.status_code != 429:
+                    breaker.record_failure()
+                else:
+                    breaker.record_success()
+                trace.extra["circuit"] = breaker.state
+                if (not e.transient or attempt >= self.retry.retries
+                        or not self.retry.can_retry(method, idempotent, e.status_code)):
+                    raise
+                delay = self.retry.delay(attempt, e.status_code, e.retry_after)
+                if time.monotonic() + delay > deadline:
+                    raise
+            finally:
+                # A probe interrupted by anything but an APIError must not leave the circuit open for good.
+                breaker.release()
+            attempt += 1
+            trace.extra["retries"] = attempt
+            with trace.phase("backoff"):
+                time.sleep(delay)
+
+    def _send(self, method: str, url: str, data: Optional[Dict[str, Any]], headers: Dict[str, str],
+              trace: RequestTrace) -> requests.Response:
+        try:
+            with trace.phase("prepare"):
+                body, saved = self._compress(data)
+                if body is None:
+                    request = requests.Request(method, url, json=data, headers=headers)
+                else:
+                    request = requests.Request(method, url, data=body, headers={**headers, "Content-Encoding": "gzip"})
+                prepared = self.session.prepare_request(request)
+                settings = self.session.merge_environment_settings(prepared.url, {}, None, None, None)
+            start = time.perf_counter()
+            # Stream so that waiting for the server and downloading the body are timed separately.
+            settings["stream"] = True
+            timeout = (min(self.connect_timeout, self.timeout), self.timeout)
+            response = self.session.send(prepared, timeout=timeout, **settings)
+            trace.add_phase("wait", max(start, trace.last_end))
+            trace.status = response.status_code
+            with trace.phase("download"):
+                body = response.content
+            if self.limiter is not None:
+                self.limiter.observe(response.status_code, response.headers, _retry_after(response))
+            # Byte counts are as sent over the wire; bytes_saved is what compression took off both ways.
+            received = response.raw.tell() if hasattr(response.raw, "tell") else len(body)
+            trace.bytes_sent = len(response.request.body or b"")
+            trace.bytes_received = received
+            trace.bytes_saved = saved + max(len(body) - received, 0)
+            response.raise_for_status()
+            return response
         except requests.exceptions.HTTPError as e:
             try:
-                error_data = response.json()
-                error_message = error_data.get('message', str(e))
+                error_message = response.json().get('message', str(e))
             except Exception:
                 error_message = str(e)
-            raise APIError(f"API error: {error_message}")
+            raise APIError(f"API error: {error_message}", response.status_code, _retry_after(response),
+                           transient=response.status_code in TRANSIENT_STATUSES)
         except requests.exceptions.ConnectionError:
-            raise APIError("Connection failed. Please check your internet connection.")
+            raise APIError("Connection failed. Please check your internet connection.", transient=True)
         except requests.exceptions.Timeout:
-            raise APIError("Request timed out. Please try again.")
+            raise APIError("Request timed out. Please try again.", transient=True)
         except requests.exceptions.RequestException as e:
             raise APIError(f"Network error: {e}")
 
+def _retry_after(response: requests.Response) -> Optional[float]:
+    """Seconds to wait from the Retry-After header, or the `retryAfter` field the Hono backend puts in a 429 body."""
+    retry_after = parse_retry_after(response.headers.get("Retry-After"))
+    if retry_after is not None or response.status_code < 400:
+        return retry_after
+    try:
+        return max(0.0, float(response.json()["retryAfter"]))
+    except Exception:
+        return None
+
+def _resource_paths(endpoint: str) -> List[str]:
+    """The endpoint and every parent collection, e.g. /tasks/5/toggle, /tasks/5, /tasks."""
+    parts = endpoint.split("?", 1)[0].rstrip("/").split("/")
+    return ["/".join(parts[:i]) for i in range(len(parts), 1, -1)]
+
 api_client = APIClient()
\ No newline at end of file
@@ -0,0 +1,82 @@
+"""
+Circuit breaker for task-manager CLI
+This module stops the client from waiting on a backend that is down: after
+repeated failures requests to that base URL fail fast until a probe succeeds.
+"""
+
+import threading
+import time
+from typing import Dict, Optional
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half-open"
+
+class CircuitBreaker:
+    """Closed -> open after `threshold` consecutive failures; open -> half-open after
+    `reset_timeout` seconds, when a single probe request is let through; the probe's
+    outcome closes or re-opens the circuit."""
+
+    def __init__(self, threshold: int = 5, reset_timeout: float = 30.0):
+        self.threshold = threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at = 0.0
+        self._state = CLOSED
+        # Thread that holds the half-open probe, if any.
+        self._probe: Optional[int] = None
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            if self._state == OPEN and time.monotonic() - self.opened_at >= self.reset_timeout:
+                return HALF_OPEN
+            return self._state
+
+    @property
+    def retry_in(self) -> float:
+        """Seconds until the next probe is allowed."""
+        return max(0.0, self.opened_at + self.reset_timeout - time.monotonic())
+
+    def allow(self) -> bool:
+        """Whether a request may be sent now."""
+        with self._lock:
+            if self._state == CLOSED:
+                return True
+            if self._probe is not None or time.monotonic() - self.opened_at < self.reset_timeout:
+                return False
+            self._state = HALF_OPEN
+            self._probe = threading.get_ident()
+            return True
+
+    def release(self):
+        """End the calling thread's probe if it finished without an outcome, so another may be sent."""
+        with self._lock:
+            if self._probe == threading.get_ident():
+                self._probe = None
+
+    def record_success(self):
+        with self._lock:
+            self._state = CLOSED
+            self.failures = 0
+            self._probe = None
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self._state == HALF_OPEN or self.failures >= self.threshold:
+                self._state = OPEN
+                self.opened_at = time.monotonic()
+            self._probe = None
+
+_breakers: Dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+def get_breaker(base_url: str, threshold: int = 5, reset_timeout: float = 30.0) -> CircuitBreaker:
+    """Return the process-wide breaker for a base URL."""
+    with _breakers_lock:
+        breaker = _breakers.get(base_url)
+        if breaker is None:
+            breaker = _breakers[base_url] = CircuitBreaker(threshold, reset_timeout)
+        return breaker
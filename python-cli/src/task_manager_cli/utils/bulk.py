@@ -0,0 +1,27 @@
+"""
+Bulk requests for task-manager CLI
+This module runs one API call per item on a bounded thread pool and collects
+per-item results, so a failure does not stop the rest of the batch.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Iterable, List, NamedTuple, Optional
+
+class BulkResult(NamedTuple):
+    item: Any
+    value: Any = None
+    error: Optional[Exception] = None
+
+def run_bulk(items: Iterable[Any], action: Callable[[Any], Any], concurrency: int = 8) -> List[BulkResult]:
+    """Call `action` on every item with at most `concurrency` in flight; results keep item order."""
+    def run(item: Any) -> BulkResult:
+        try:
+            return BulkResult(item, action(item))
+        except Exception as e:
+            return BulkResult(item, error=e)
+
+    items = [*items]
+    if not items:
+        return []
+    with ThreadPoolExecutor(max_workers=max(1, min(concurrency, len(items)))) as pool:
+        return [*pool.map(run, items)]
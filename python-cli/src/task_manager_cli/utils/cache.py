@@ -0,0 +1,139 @@
+"""
+HTTP response cache for task-manager CLI
+This module stores GET response bodies on disk with their ETag/Last-Modified
+validators so repeated requests can be revalidated with a conditional GET.
+"""
+
+import fnmatch
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from typing import Dict, Mapping, Optional
+
+class CacheEntry:
+    def __init__(self, key: str, meta: Dict[str, object], body: bytes):
+        self.key = key
+        self.url = meta.get("url")
+        self.etag = meta.get("etag")
+        self.last_modified = meta.get("last_modified")
+        self.stored_at = float(meta.get("stored_at", 0))
+        self.body = body
+
+    def is_fresh(self, ttl: float) -> bool:
+        return ttl > 0 and time.time() - self.stored_at < ttl
+
+    def validators(self) -> Dict[str, str]:
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+class ResponseCache:
+    """Size-bounded LRU cache of response bodies, one `.json`/`.body` file pair per URL.
+
+    Recency is the modification time of the metadata file, which is touched on
+    every hit; the least recently used entries are evicted once the bodies
+    exceed `max_bytes`.
+    """
+
+    def __init__(self, directory: str, max_bytes: int = 50 * 1024 * 1024, default_ttl: float = 0,
+                 ttl_overrides: Optional[Mapping[str, float]] = None):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+        self.ttl_overrides = dict(ttl_overrides or {})
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(url: str, token: Optional[str] = None) -> str:
+        return hashlib.sha256(f"{token or ''} {url}".encode("utf-8")).hexdigest()
+
+    def ttl(self, endpoint: str) -> float:
+        """TTL for an endpoint; overrides are glob patterns such as "/categories*"."""
+        path = endpoint.split("?", 1)[0]
+        for pattern, ttl in self.ttl_overrides.items():
+            if fnmatch.fnmatchcase(path, pattern):
+                return float(ttl)
+        return self.default_ttl
+
+    def _paths(self, key: str):
+        base = os.path.join(self.directory, key)
+        return base + ".json", base + ".body"
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        meta_path, body_path = self._paths(key)
+        try:
+            with open(meta_path, "r") as f:
+                meta = json.load(f)
+            with open(body_path, "rb") as f:
+                body = f.read()
+        except (OSError, ValueError):
+            return None
+        return CacheEntry(key, meta, body)
+
+    def touch(self, entry: CacheEntry):
+        """Mark an entry as used and restart its TTL after a successful revalidation."""
+        entry.stored_at = time.time()
+        self._write_meta(entry.key, entry.url, entry.etag, entry.last_modified, entry.stored_at)
+
+    def store(self, key: str, url: str, headers: Mapping[str, str], body: bytes) -> bool:
+        """Store a response if it carries a validator; returns whether it was stored."""
+        etag = headers.get("ETag")
+        last_modified = headers.get("Last-Modified")
+        if not etag and not last_modified or len(body) > self.max_bytes:
+            return False
+        os.makedirs(self.directory, exist_ok=True)
+        self._atomic_write(self._paths(key)[1], body)
+        self._write_meta(key, url, etag, last_modified, time.time())
+        self._evict()
+        return True
+
+    def invalidate(self, key: str):
+        for path in self._paths(key):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def _write_meta(self, key: str, url, etag, last_modified, stored_at: float):
+        meta = {"url": url, "etag": etag, "last_modified": last_modified, "stored_at": stored_at}
+        self._atomic_write(self._paths(key)[0], json.dumps(meta).encode("utf-8"))
+
+    def _atomic_write(self, path: str, data: bytes):
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+    def _evict(self):
+        with self._lock:
+            entries = []
+            total = 0
+            for name in os.listdir(self.directory):
+                if not name.endswith(".json"):
+                    continue
+                key = name[:-len(".json")]
+                meta_path, body_path = self._paths(key)
+                try:
+                    used = os.path.getmtime(meta_path)
+                    size = os.path.getsize(body_path)
+                except OSError:
+                    continue
+                entries.append((used, key, size))
+                total += size
+            if total <= self.max_bytes:
+                return
+            for used, key, size in sorted(entries):
+                self.invalidate(key)
+                total -= size
+                if total <= self.max_bytes:
+                    break
@@ -0,0 +1,70 @@
+"""
+Category name index for task-manager CLI
+This module keeps a small on-disk name -> id map so commands can accept a
+category name without fetching /categories every time.
+"""
+
+import json
+import os
+from typing import Any, Dict, Iterable, Optional
+from .api import APIClient, api_client
+from .config import config
+
+class CategoryIndex:
+    """Name -> id index for one profile and base URL, refreshed lazily on a miss."""
+
+    def __init__(self, client: APIClient, path: str):
+        self.client = client
+        self.path = path
+        self._names: Optional[Dict[str, int]] = None
+
+    def _load(self) -> Dict[str, int]:
+        if self._names is None:
+            self._names = {}
+            try:
+                with open(self.path, "r") as f:
+                    data = json.load(f)
+                if data.get("base_url") == self.client.base_url:
+                    self._names = data.get("names", {})
+            except (OSError, ValueError):
+                pass
+        return self._names
+
+    def update(self, categories: Iterable[Dict[str, Any]]):
+        """Replace the index from a full /categories response."""
+        self._names = {
+            str(category.get("name", "")).casefold(): category.get("id")
+            for category in categories if category.get("id") is not None
+        }
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp = f"{self.path}.tmp"
+        with open(tmp, "w") as f:
+            json.dump({"base_url": self.client.base_url, "names": self._names}, f)
+        os.replace(tmp, self.path)
+
+    def refresh(self):
+        self.update(self.client.request("GET", "/categories"))
+
+    def clear(self):
+        """Forget the index, e.g. after a category was created, renamed or deleted."""
+        self._names = None
+        try:
+            os.remove(self.path)
+        except OSError:
+            pass
+
+    def resolve(self, value: str) -> int:
+        """Return the id for a category id or (case-insensitive) name."""
+        value = value.strip()
+        if value.isdigit():
+            return int(value)
+        key = value.casefold()
+        category_id = self._load().get(key)
+        if category_id is None:
+            self.refresh()
+            category_id = self._names.get(key)
+        if category_id is None:
+            raise ValueError(f"Unknown category: {value}")
+        return category_id
+
+category_index = CategoryIndex(api_client, os.path.join(config.CONFIG_DIR, f"categories-{config.API_PROFILE}.json"))
@@ -159,13 +159,86 @@ Configuration management utilities
 #     save_all_config(all_conf)
 #     # Optionally clear profiles in secure store (e.g., keyring) if implemented
 
+import json
 import os
+from typing import Any, Callable, Dict
 from dotenv import load_dotenv
 
 load_dotenv()
 
+class ConfigError(Exception):
+    """Configuration related errors"""
+    pass
+
+def load_profiles(path: str) -> Dict[str, Dict[str, Any]]:
+    """Load per-profile settings, keyed by profile name."""
+    if not os.path.exists(path):
+        return {}
+    try:
+        with open(path, "r") as f:
+            profiles = json.load(f)
+    except (OSError, json.JSONDecodeError) as e:
+        raise ConfigError(f"Invalid profiles file {path}: {e}")
+    if not isinstance(profiles, dict) or not all(isinstance(profile, dict) for profile in profiles.values()):
+        raise ConfigError(f"Invalid profiles file {path}: expected an object of profile objects")
+    return profiles
+
+def as_bool(value: Any) -> bool:
+    """Cast a setting such as "0", "false" or True to a boolean."""
+    if isinstance(value, str):
+        return value.strip().lower() not in ("", "0", "false", "no", "off")
+    return bool(value)
+
 class Config:
+    """Connection settings and per-profile options.
+
+    Numeric settings and the profiles file are read on first use, not at
+    import, so a bad value fails the command that needs it with a ConfigError
+    instead of breaking every command.
+    """
     API_BASE_URL = os.getenv("API_BASE_URL", "http://localhost:3000")
-    API_TIMEOUT = int(os.getenv("API_TIMEOUT", 30))
+    API_TRACE_FILE = os.getenv("API_TRACE_FILE")
+    API_PROFILE = os.getenv("API_PROFILE", "default")
+    CONFIG_DIR = os.getenv("TASK_MANAGER_CONFIG_DIR", os.path.join(os.path.expanduser("~"), ".task_manager_cli"))
+
+    def __init__(self):
+        self._profile = None
+
+    @property
+    def API_TIMEOUT(self) -> int:
+        return self.setting("timeout", 30, int)
+
+    @property
+    def API_RETRIES(self) -> int:
+        return self.setting("retries", 3, int)
+
+    @property
+    def API_RETRY_BACKOFF(self) -> float:
+        return self.setting("retry_backoff", 0.5, float)
+
+    @property
+    def API_RETRY_BUDGET(self) -> float:
+        return self.setting("retry_budget", 60, float)
+
+    @property
+    def profile(self) -> Dict[str, Any]:
+        """Settings of the active profile from CONFIG_DIR/profiles.json."""
+        if self._profile is None:
+            profiles = load_profiles(os.path.join(self.CONFIG_DIR, "profiles.json"))
+            self._profile = profiles.get(self.API_PROFILE, {})
+        return self._profile
+
+    def setting(self, name: str, default: Any, cast: Callable[[Any], Any] = str) -> Any:
+        """Resolve a setting from API_<NAME>, then the active profile, then the default."""
+        variable = f"API_{name.upper()}"
+        value = os.getenv(variable)
+        if value is None:
+            value = self.profile.get(name, default)
+        if value is None:
+            return None
+        try:
+            return cast(value)
+        except (TypeError, ValueError):
+            raise ConfigError(f"Invalid value {value!r} for {variable} (profile setting {name!r})")
     
 config = Config()
\ No newline at end of file
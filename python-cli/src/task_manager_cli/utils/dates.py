@@ -0,0 +1,68 @@
+"""
+Timestamp parsing for task-manager CLI
+This module parses the ISO-8601 timestamps sent by the backend, including the
+`Z` suffix that `datetime.fromisoformat` rejects before Python 3.11, and
+memoizes the results because many tasks share the same dates.
+"""
+
+import re
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from typing import Optional
+
+_ISO_8601 = re.compile(
+    r"(\d{4})-(\d{2})-(\d{2})"
+    r"(?:[T ](\d{2}):(\d{2})(?::(\d{2})(?:[.,](\d+))?)?)?"
+    r"\s*(Z|[+-]\d{2}(?::?\d{2})?)?$",
+    re.IGNORECASE,
+)
+
+@lru_cache(maxsize=None)
+def _offset(value: str) -> timezone:
+    if value in ("Z", "z", "+00:00", "+0000", "+00", "-00:00"):
+        return timezone.utc
+    sign = -1 if value[0] == "-" else 1
+    digits = value[1:].replace(":", "")
+    minutes = int(digits[:2]) * 60 + int(digits[2:4] or 0)
+    return timezone(sign * timedelta(minutes=minutes))
+
+def parse_timestamp(value: Optional[str]) -> Optional[datetime]:
+    """Parse an ISO-8601 date or timestamp, returning None if it is empty or invalid.
+
+    Accepts `YYYY-MM-DD`, an optional `T` or space separated time with any
+    number of fractional digits (truncated to microseconds), and a `Z` or
+    `±HH[:MM]` offset. Results are cached per input string.
+    """
+    # Checked outside the cache, which would raise TypeError hashing a list or dict.
+    if isinstance(value, str) and value:
+        return _parse_iso(value)
+    return None
+
+# Sized so the created_at/updated_at values of a large listing do not evict the
+# shared due dates; an LRU that thrashes is slower than no cache at all.
+@lru_cache(maxsize=65536)
+def _parse_iso(value: str) -> Optional[datetime]:
+    # Fast path: the C parser, which accepts `Z` itself from Python 3.11.
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        pass
+    text = value.strip()
+    if text[-1:] in ("Z", "z"):
+        try:
+            return datetime.fromisoformat(text[:-1] + "+00:00")
+        except ValueError:
+            pass
+    match = _ISO_8601.match(text)
+    if match is None:
+        return None
+    year, month, day, hour, minute, second, fraction, offset = match.groups()
+    try:
+        return datetime(
+            int(year), int(month), int(day),
+            int(hour or 0), int(minute or 0), int(second or 0),
+            int(fraction[:6].ljust(6, "0")) if fraction else 0,
+            tzinfo=_offset(offset) if offset else None,
+        )
+    except ValueError:
+        return None
@@ -0,0 +1,26 @@
+"""
+Snapshot diffing for task-manager CLI
+This module compares two task snapshots keyed by id and version (updated_at).
+"""
+
+from typing import Any, Dict, Hashable, Iterable, Mapping, NamedTuple, Set
+
+class SnapshotDiff(NamedTuple):
+    added: Set[Hashable]
+    removed: Set[Hashable]
+    changed: Set[Hashable]
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed or self.changed)
+
+def versions(records: Iterable[Mapping[str, Any]], version_field: str = "updated_at") -> Dict[Hashable, Any]:
+    """Map each record's id to its version, as used by `diff_versions`."""
+    return {record.get("id"): record.get(version_field) for record in records}
+
+def diff_versions(previous: Mapping[Hashable, Any], current: Mapping[Hashable, Any]) -> SnapshotDiff:
+    """Ids added, removed and changed (different version) between two snapshots."""
+    added = current.keys() - previous.keys()
+    removed = previous.keys() - current.keys()
+    changed = {key for key, version in current.items()
+               if key in previous and previous[key] != version}
+    return SnapshotDiff(set(added), set(removed), changed)
@@ -0,0 +1,30 @@
+"""
+Due-date index for task-manager CLI
+This module sorts tasks by due date once so date-range queries are two
+binary searches instead of a scan.
+"""
+
+from bisect import bisect_left
+from typing import Any, Dict, Iterable, List
+from .dates import parse_timestamp
+
+class DueIndex:
+    """Raw task mappings ordered by due date (epoch seconds); undated tasks are left out."""
+
+    def __init__(self, rows: Iterable[Dict[str, Any]]):
+        dated = []
+        for row in rows:
+            due = parse_timestamp(row.get("due_date"))
+            if due is not None:
+                dated.append((due.timestamp(), row.get("id") or 0, row))
+        dated.sort(key=lambda item: item[:2])
+        self.keys = [item[0] for item in dated]
+        self.rows = [item[2] for item in dated]
+
+    def between(self, start: float, end: float) -> List[Dict[str, Any]]:
+        """Tasks due in [start, end)."""
+        return self.rows[bisect_left(self.keys, start):bisect_left(self.keys, end)]
+
+    def overdue(self, before: float) -> List[Dict[str, Any]]:
+        """Open tasks due before `before`."""
+        return [row for row in self.rows[:bisect_left(self.keys, before)] if not row.get("completed")]
@@ -0,0 +1,82 @@
+"""
+In-process request memoization for task-manager CLI
+This module remembers GET results for a short TTL and coalesces concurrent
+identical GETs into a single in-flight request (single-flight).
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Iterable, Optional, Tuple
+
+HIT = "hit"
+SHARED = "shared"
+MISS = "miss"
+
+class _Flight:
+    def __init__(self):
+        self.done = threading.Event()
+        self.value: Any = None
+        self.error: Optional[BaseException] = None
+
+class Memo:
+    """TTL + LRU memo table keyed by (method, url, ...) tuples.
+
+    Results are shared between callers and must be treated as read-only.
+    """
+
+    def __init__(self, ttl: float = 10.0, max_entries: int = 1024):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._flights: Dict[Hashable, _Flight] = {}
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def call(self, key: Tuple, fetch: Callable[[], Any]) -> Tuple[Any, str]:
+        """Return (value, how) where how is HIT, SHARED (joined an in-flight call) or MISS."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry[0] > time.monotonic():
+                    self._entries.move_to_end(key)
+                    return entry[1], HIT
+                del self._entries[key]
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+                generation = self._generation
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.value, SHARED
+        try:
+            flight.value = fetch()
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
+                # Skip storing if a mutation invalidated entries while we were fetching.
+                if flight.error is None and self.ttl > 0 and generation == self._generation:
+                    self._entries[key] = (time.monotonic() + self.ttl, flight.value)
+                    while len(self._entries) > self.max_entries:
+                        self._entries.popitem(last=False)
+            flight.done.set()
+        return flight.value, MISS
+
+    def invalidate(self, urls: Iterable[str]):
+        """Drop entries whose key (method, url, ...) refers to one of `urls`."""
+        stale = set(urls)
+        with self._lock:
+            self._generation += 1
+            for key in [key for key in self._entries if key[1] in stale]:
+                del self._entries[key]
+
+    def clear(self):
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
@@ -0,0 +1,213 @@
+"""
+Parallel JSON decoding for task-manager CLI
+This module decodes very large task arrays in a process pool. The body is
+split at object boundaries, each worker decodes one segment into compact
+columns, and the parent merges them into a TaskColumns sequence.
+"""
+
+import json
+import math
+import os
+import re
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+from ..models import PRIORITY_CODES, STATUS_CODES, Task
+from .dates import parse_timestamp
+from .snapshot import INT_FIELDS, NO_INT, TEXT_FIELDS, TIME_FIELDS
+
+TASK_FIELDS = ("id", "title", "description", "status", "due_date", "priority", "completed",
+               "user_id", "category_id", "created_at", "updated_at")
+_TASK_KEYS = frozenset(TASK_FIELDS)
+_ALL_PRESENT = (1 << len(TASK_FIELDS)) - 1
+# Quotes inside strings are escaped, so `},{"` only occurs in a string that ends in `},{`.
+_OBJECT_BOUNDARY = re.compile(rb'\}\s*,\s*\{\s*"')
+
+def split_array(body: bytes, parts: int) -> List[bytes]:
+    """Split a JSON array of objects into about `parts` smaller JSON arrays.
+
+    Cuts are made at the first `},{"` after each target offset. One that falls
+    inside a string produces a segment that fails to decode, and the caller
+    falls back to a single json.loads.
+    """
+    start = body.index(b"[") + 1
+    end = body.rindex(b"]")
+    step = max((end - start) // max(parts, 1), 1)
+    segments = []
+    position = start
+    while position < end:
+        match = _OBJECT_BOUNDARY.search(body, position + step, end) if position + step < end else None
+        cut = match.start() + 1 if match else end
+        segments.append(b"[" + body[position:cut] + b"]")
+        position = body.index(b"{", cut) if match else end
+    return segments
+
+def _timestamps(values: List[Any], epochs: Dict[Any, float]) -> array:
+    """Epoch seconds (NaN if missing), converting each distinct string once via `epochs`."""
+    stamps = []
+    for value in values:
+        epoch = epochs.get(value)
+        if epoch is None:
+            parsed = parse_timestamp(value) if value else None
+            epoch = epochs[value] = parsed.timestamp() if parsed else math.nan
+        stamps.append(epoch)
+    return array("d", stamps)
+
+def _codes(values: List[Any]) -> Tuple[array, List[Any]]:
+    table: Dict[Any, int] = {}
+    return array("H", [table.setdefault(value, len(table)) for value in values]), [*table]
+
+def _is_task(row: Any) -> bool:
+    return (isinstance(row, dict) and isinstance(row.get("id"), int) and "title" in row
+            and ("completed" in row or "status" in row))
+
+def _present(row: Dict[str, Any]) -> int:
+    """Bitmask of the TASK_FIELDS that `row` has, so missing keys are not filled in on the way back."""
+    if row.keys() >= _TASK_KEYS:
+        return _ALL_PRESENT
+    return sum(1 << bit for bit, name in enumerate(TASK_FIELDS) if name in row)
+
+def _decode_segment(segment: bytes) -> Dict[str, Any]:
+    """Worker: decode one segment into columns that pickle as a few flat objects."""
+    rows = json.loads(segment)
+    if not all(_is_task(row) for row in rows):
+        raise ValueError("Not a task array")
+    columns = {name: array("q", [NO_INT if value is None else value for value in (row.get(name) for row in rows)])
+               for name in INT_FIELDS}
+    texts = {name: [row.get(name) for row in rows] for name in TEXT_FIELDS}
+    epochs: Dict[Any, float] = {}
+    for name, column in TIME_FIELDS.items():
+        columns[column] = _timestamps(texts[name], epochs)
+    columns["status"], statuses = _codes([row.get("status", "pending") for row in rows])
+    columns["priority"], priorities = _codes([row.get("priority", "MEDIUM") for row in rows])
+    columns["completed"] = array("B", [bool(row.get("completed")) for row in rows])
+    columns["present"] = array("H", [_present(row) for row in rows])
+    # Keep fields the columns do not cover, so rows round-trip unchanged.
+    extra_keys = [row.keys() - _TASK_KEYS for row in rows]
+    extras = [{key: row[key] for key in keys} if keys else None for row, keys in zip(rows, extra_keys)]
+    return {
+        "count": len(rows),
+        "columns": {name: (column.typecode, column.tobytes()) for name, column in columns.items()},
+        "texts": texts,
+        "statuses": statuses,
+        "priorities": priorities,
+        "extras": extras,
+    }
+
+def _merge_codes(table: List[Any], values: List[Any]) -> List[int]:
+    """Add `values` to `table` and return each value's index in it."""
+    for value in values:
+        if value not in table:
+            table.append(value)
+    return [table.index(value) for value in values]
+
+class TaskColumns(Sequence):
+    """Decoded tasks held as columns, readable as a sequence of row mappings.
+
+    It exposes the same `columns`, `statuses`/`priorities` and code-mapping
+    methods as Snapshot, so column-based stats and trends accept either.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.columns: Dict[str, array] = {}
+        self.texts: Dict[str, List[Optional[str]]] = {name: [] for name in TEXT_FIELDS}
+        self.statuses: List[Any] = []
+        self.priorities: List[Any] = []
+        self.extras: List[Optional[Dict[str, Any]]] = []
+
+    def extend(self, segment: Dict[str, Any]):
+        """Append one worker's segment, renumbering its status and priority codes."""
+        remap = {
+            "status": _merge_codes(self.statuses, segment["statuses"]),
+            "priority": _merge_codes(self.priorities, segment["priorities"]),
+        }
+        for name, (typecode, data) in segment["columns"].items():
+            column = self.columns.setdefault(name, array(typecode))
+            if name in remap and remap[name] != [*range(len(remap[name]))]:
+                codes = array(typecode)
+                codes.frombytes(data)
+                column.extend(remap[name][code] for code in codes)
+            else:
+                column.frombytes(data)
+        for name, values in segment["texts"].items():
+            self.texts[name].extend(values)
+        self.extras.extend(segment["extras"])
+        self.count += segment["count"]
+
+    def __len__(self) -> int:
+        return self.count
+
+    def row(self, index: int) -> Dict[str, Any]:
+        def number(name: str) -> Optional[int]:
+            value = self.columns[name][index]
+            return None if value == NO_INT else value
+        texts = self.texts
+        row = {
+            "id": number("id"),
+            "title": texts["title"][index],
+            "description": texts["description"][index],
+            "status": self.statuses[self.columns["status"][index]],
+            "due_date": texts["due_date"][index],
+            "priority": self.priorities[self.columns["priority"][index]],
+            "completed": bool(self.columns["completed"][index]),
+            "user_id": number("user_id"),
+            "category_id": number("category_id"),
+            "created_at": texts["created_at"][index],
+            "updated_at": texts["updated_at"][index],
+        }
+        # The keys above are in TASK_FIELDS order, matching the bits of the "present" mask.
+        present = self.columns["present"][index]
+        if present != _ALL_PRESENT:
+            row = {name: value for bit, (name, value) in enumerate(row.items()) if present >> bit & 1}
+        if self.extras[index]:
+            row.update(self.extras[index])
+        return row
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self.row(i) for i in range(*index.indices(self.count))]
+        if index < 0:
+            index += self.count
+        if not 0 <= index < self.count:
+            raise IndexError("TaskColumns index out of range")
+        return self.row(index)
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        return (self.row(index) for index in range(self.count))
+
+    def rows(self) -> List[Dict[str, Any]]:
+        return [*self]
+
+    def status_codes(self) -> List[int]:
+        return [STATUS_CODES.code(value) for value in self.statuses]
+
+    def priority_codes(self) -> List[int]:
+        return [PRIORITY_CODES.code(value) for value in self.priorities]
+
+    def tasks(self) -> Iterator[Task]:
+        return (Task(row) for row in self)
+
+def parallel_decode(body: bytes, workers: int) -> Optional[TaskColumns]:
+    """Decode a JSON task array in `workers` processes, or None if it cannot be split or decoded."""
+    try:
+        segments = split_array(body, workers * 2)
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            parts = [*pool.map(_decode_segment, segments)]
+    except (ValueError, TypeError, OverflowError):
+        return None
+    result = TaskColumns()
+    for part in parts:
+        result.extend(part)
+    return result
+
+def decode_json(body: bytes, min_bytes: int, workers: int) -> Any:
+    """json.loads, or a parallel TaskColumns decode for task arrays of at least `min_bytes`."""
+    if workers > 1 and len(body) >= min_bytes and body.lstrip()[:1] == b"[":
+        columns = parallel_decode(body, workers)
+        if columns is not None:
+            return columns
+    return json.loads(body)
+
+def default_workers() -> int:
+    return os.cpu_count() or 1
@@ -0,0 +1,127 @@
+"""
+Profiling support for task-manager CLI
+This module wraps a command in cProfile or tracemalloc for the --profile option
+and can write collapsed stacks for flamegraph tools.
+"""
+
+import cProfile
+import io
+import os
+import pstats
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from enum import Enum
+from typing import Optional
+from rich.console import Console
+
+class ProfileMode(str, Enum):
+    CPU = "cpu"
+    ALLOC = "alloc"
+
+def _frame_label(frame) -> str:
+    code = frame.f_code
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+class StackSampler:
+    """Samples the stack of one thread at a fixed interval into collapsed-stack counts."""
+
+    def __init__(self, thread_id: int, interval: float = 0.001):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.counts: Counter = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+            while frame is not None:
+                stack.append(_frame_label(frame))
+                frame = frame.f_back
+            if stack:
+                self.counts[";".join(reversed(stack))] += 1
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+
+class Profiler:
+    """Profiles the running command for CPU time or memory allocations."""
+
+    def __init__(self, mode: ProfileMode, output: Optional[str] = None, limit: int = 25):
+        self.mode = mode
+        self.output = output
+        self.limit = limit
+        self._profile: Optional[cProfile.Profile] = None
+        self._sampler: Optional[StackSampler] = None
+        self._started = 0.0
+
+    def start(self):
+        self._started = time.perf_counter()
+        if self.mode == ProfileMode.CPU:
+            if self.output:
+                self._sampler = StackSampler(threading.get_ident())
+                self._sampler.start()
+            self._profile = cProfile.Profile()
+            self._profile.enable()
+        else:
+            tracemalloc.start(25)
+
+    def stop(self, console: Console):
+        elapsed = time.perf_counter() - self._started
+        if self.mode == ProfileMode.CPU:
+            self._profile.disable()
+            if self._sampler:
+                self._sampler.stop()
+            self._report_cpu(console, elapsed)
+        else:
+            snapshot = tracemalloc.take_snapshot()
+            current, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            self._report_alloc(console, snapshot, current, peak)
+
+    def _report_cpu(self, console: Console, elapsed: float):
+        out = io.StringIO()
+        stats = pstats.Stats(self._profile, stream=out)
+        stats.strip_dirs().sort_stats("cumulative").print_stats(self.limit)
+        console.print(f"[bold cyan]CPU profile[/bold cyan] ({elapsed * 1000:.1f} ms wall)")
+        console.print(out.getvalue(), markup=False, highlight=False)
+        if self.output:
+            self._write_collapsed(self._sampler.counts)
+            console.print(f"[green]Collapsed stacks written to {self.output}[/green]")
+
+    def _report_alloc(self, console: Console, snapshot, current: int, peak: int):
+        snapshot = snapshot.filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, __file__),
+        ))
+        console.print(
+            f"[bold cyan]Allocation profile[/bold cyan] "
+            f"(current {current / 1024:.1f} KiB, peak {peak / 1024:.1f} KiB)"
+        )
+        for stat in snapshot.statistics("lineno")[:self.limit]:
+            frame = stat.traceback[0]
+            console.print(
+                f"{stat.size / 1024:10.1f} KiB {stat.count:8d} blocks  "
+                f"{frame.filename}:{frame.lineno}",
+                markup=False, highlight=False
+            )
+        if self.output:
+            counts: Counter = Counter()
+            for stat in snapshot.statistics("traceback"):
+                frames = [f"{os.path.basename(f.filename)}:{f.lineno}" for f in stat.traceback]
+                counts[";".join(frames)] += stat.size
+            self._write_collapsed(counts)
+            console.print(f"[green]Collapsed stacks (bytes) written to {self.output}[/green]")
+
+    def _write_collapsed(self, counts: Counter):
+        with open(self.output, "w") as f:
+            for stack, count in counts.most_common():
+                f.write(f"{stack} {count}\n")
@@ -0,0 +1,142 @@
+"""
+Client-side rate limiting for task-manager CLI
+This module provides a thread-safe token bucket whose rate adapts to the
+server's responses (additive increase, multiplicative decrease).
+"""
+
+import math
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Mapping, Optional
+
+def _seconds_until_reset(value: str, now: float) -> Optional[float]:
+    """Parse X-RateLimit-Reset as an ISO date, epoch seconds or delta seconds."""
+    try:
+        number = float(value)
+    except ValueError:
+        try:
+            reset = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            return None
+        if reset.tzinfo is None:
+            reset = reset.replace(tzinfo=timezone.utc)
+        return reset.timestamp() - now
+    # Values this large are absolute epoch timestamps, otherwise a delay.
+    return number - now if number > 1e9 else number
+
+def _number(value: Optional[str]) -> Optional[float]:
+    try:
+        return float(value) if value is not None else None
+    except ValueError:
+        return None
+
+class RateLimiter:
+    """Token bucket shared by every request (and thread) of one API client.
+
+    The rate grows by `increase` requests/second after each successful response
+    and is multiplied by `decrease` on a 429. It probes upwards to a ceiling:
+    `max_rate` if given, and the server's X-RateLimit-Limit spread over its
+    window once that header is seen; without either it keeps growing until
+    the server pushes back. When the server sends X-RateLimit-Remaining/Reset,
+    the rate is also capped so the remaining budget lasts until the window resets.
+
+    With `rate` None the bucket starts unbounded: requests pass straight
+    through and are counted, until the first 429 (which starts it at half the
+    rate actually sent) or the first X-RateLimit-* budget (which starts it there).
+    """
+
+    def __init__(self, rate: Optional[float], burst: Optional[float] = None, max_rate: Optional[float] = None,
+                 min_rate: float = 0.1, increase: float = 0.1, decrease: float = 0.5):
+        self.rate = rate
+        self.max_rate = max_rate
+        self.min_rate = min_rate
+        self.increase = increase
+        self.decrease = decrease
+        self._burst = burst
+        self.burst = self.tokens = burst or (max(rate * 2, 1) if rate else 0)
+        self.blocked_until = 0.0
+        # Requests passed through while unbounded, and since when, to start a 429 from the rate sent.
+        self._sent = 0
+        self._since: Optional[float] = None
+        # Longest time to a reset seen so far, which approximates the server's window.
+        self.window = 0.0
+        self.advertised_rate: Optional[float] = None
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    @property
+    def ceiling(self) -> float:
+        limits = [limit for limit in (self.max_rate, self.advertised_rate) if limit]
+        return min(limits) if limits else math.inf
+
+    def _start(self, rate: float, now: float, tokens: Optional[float]):
+        """Switch an unbounded bucket on at `rate`, holding at most `tokens` (None: a full bucket)."""
+        self.rate = rate
+        self.burst = self._burst or max(rate * 2, 1)
+        self.tokens = self.burst if tokens is None else min(self.burst, tokens)
+        self._updated = now
+
+    def _sent_rate(self, now: float) -> float:
+        """Requests per second passed through while unbounded, over at least the last second."""
+        return self._sent / max(now - (self._since or now), 1.0)
+
+    def _refill(self, now: float):
+        self.tokens = min(self.burst, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self) -> float:
+        """Block until a request may be sent; returns the seconds spent waiting."""
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                if self.rate is None:
+                    self._sent += 1
+                    if self._since is None:
+                        self._since = now
+                    return waited
+                self._refill(now)
+                if now >= self.blocked_until and self.tokens >= 1:
+                    self.tokens -= 1
+                    return waited
+                delay = max(self.blocked_until - now, (1 - self.tokens) / self.rate)
+            time.sleep(delay)
+            waited += delay
+
+    def _window(self, headers: Mapping[str, str]) -> Optional[float]:
+        """Seconds until the server's window resets, updating `window` and the advertised rate."""
+        reset = headers.get("X-RateLimit-Reset")
+        window = _seconds_until_reset(reset, time.time()) if reset is not None else None
+        if window is None or window <= 0:
+            return None
+        self.window = max(self.window, window)
+        limit = _number(headers.get("X-RateLimit-Limit"))
+        if limit:
+            self.advertised_rate = limit / self.window
+        return window
+
+    def observe(self, status_code: int, headers: Mapping[str, str], retry_after: Optional[float] = None):
+        """Adapt the rate to one response."""
+        with self._lock:
+            now = time.monotonic()
+            if status_code == 429:
+                if self.rate is None:
+                    self._start(self._sent_rate(now), now, tokens=0)
+                self._refill(now)
+                self.rate = max(self.min_rate, self.rate * self.decrease)
+                self.tokens = 0
+                if retry_after:
+                    self.blocked_until = max(self.blocked_until, now + retry_after)
+                return
+            window = self._window(headers)
+            remaining = _number(headers.get("X-RateLimit-Remaining")) if window else None
+            if self.rate is None:
+                budget = min(self.ceiling, remaining / window if remaining is not None else math.inf)
+                if budget < math.inf:
+                    self._start(max(self.min_rate, budget), now, tokens=remaining)
+                return
+            self._refill(now)
+            self.rate = max(self.min_rate, min(self.ceiling, self.rate + self.increase))
+            if remaining is not None:
+                self.rate = max(self.min_rate, min(self.rate, remaining / window))
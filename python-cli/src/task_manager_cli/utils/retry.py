@@ -0,0 +1,54 @@
+"""
+Retry policy for task-manager CLI
+This module decides whether and when a failed API request is retried.
+"""
+
+import random
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+TRANSIENT_STATUSES = frozenset({429, 502, 503, 504})
+RETRY_AFTER_STATUSES = frozenset({429, 503})
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header given in seconds or as an HTTP date."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+class RetryPolicy:
+    """Exponential backoff with full jitter, bounded by attempts and a total time budget.
+
+    Idempotent methods and requests carrying an idempotency key are retried on any
+    transient failure. Other requests are only retried on 429, which the backend's
+    rate limiter returns before the request is processed.
+    """
+
+    def __init__(self, retries: int = 3, backoff: float = 0.5, max_delay: float = 30.0, budget: float = 60.0):
+        self.retries = retries
+        self.backoff = backoff
+        self.max_delay = max_delay
+        self.budget = budget
+
+    def can_retry(self, method: str, idempotent: bool, status_code: Optional[int]) -> bool:
+        if idempotent or method.upper() in IDEMPOTENT_METHODS:
+            return True
+        return status_code == 429
+
+    def delay(self, attempt: int, status_code: Optional[int] = None, retry_after: Optional[float] = None) -> float:
+        """Seconds to wait before retry number `attempt` (0-based)."""
+        if retry_after is not None and status_code in RETRY_AFTER_STATUSES:
+            return retry_after
+        return random.uniform(0, min(self.max_delay, self.backoff * (2 ** attempt)))
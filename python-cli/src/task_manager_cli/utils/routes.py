@@ -0,0 +1,46 @@
+"""
+Missing-route memory for task-manager CLI
+This module remembers, per base URL, optional server routes that answered
+404 or 405, so commands skip them for a while instead of failing every run.
+"""
+
+import json
+import os
+import time
+from typing import Dict, Optional
+from .config import config
+
+class MissingRoutes:
+    """Routes a server does not have, each forgotten `ttl` seconds after it was recorded."""
+
+    def __init__(self, path: str, ttl: float = 24 * 3600):
+        self.path = path
+        self.ttl = ttl
+        self._routes: Optional[Dict[str, Dict[str, float]]] = None
+
+    def _load(self) -> Dict[str, Dict[str, float]]:
+        if self._routes is None:
+            self._routes = {}
+            try:
+                with open(self.path, "r") as f:
+                    data = json.load(f)
+                if isinstance(data, dict):
+                    self._routes = data
+            except (OSError, ValueError):
+                pass
+        return self._routes
+
+    def missing(self, base_url: str, route: str) -> bool:
+        recorded = self._load().get(base_url, {}).get(route)
+        return isinstance(recorded, (int, float)) and time.time() - recorded < self.ttl
+
+    def add(self, base_url: str, route: str):
+        routes = self._load()
+        routes.setdefault(base_url, {})[route] = time.time()
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp = f"{self.path}.tmp"
+        with open(tmp, "w") as f:
+            json.dump(routes, f)
+        os.replace(tmp, self.path)
+
+missing_routes = MissingRoutes(os.path.join(config.CONFIG_DIR, "missing-routes.json"))
@@ -0,0 +1,242 @@
+"""
+Binary task snapshot for task-manager CLI
+This module writes the synced task set as fixed-width columns plus a string
+heap, and reads it back through mmap so commands can start without parsing
+JSON and concurrent CLI processes share the same pages.
+
+Layout: an 8-byte magic, a uint32 task count and a uint32 header length,
+a JSON header (byte order, status/priority tables, column offsets), then
+8-byte aligned native-endian columns, then the UTF-8 string heap. Strings
+are stored once and referenced by (offset, length) columns; empty strings
+have length 0 and take no heap space.
+"""
+
+import json
+import math
+import mmap
+import os
+import struct
+import sys
+from array import array
+from typing import Any, Dict, Iterator, List, Optional
+from ..models import PRIORITY_CODES, STATUS_CODES, Task
+from .dates import parse_timestamp
+
+MAGIC = b"TMSNAP01"
+PREFIX = struct.Struct("<8sII")
+NO_INT = -(2 ** 63)
+NO_TEXT = 0xFFFFFFFF
+
+INT_FIELDS = ("id", "category_id", "user_id")
+TIME_FIELDS = {"due_date": "due", "created_at": "created", "updated_at": "updated"}
+TEXT_FIELDS = ("title", "description", "due_date", "created_at", "updated_at")
+
+def _align(offset: int) -> int:
+    return (offset + 7) & ~7
+
+def _epoch(value: Any) -> float:
+    parsed = parse_timestamp(value)
+    return parsed.timestamp() if parsed else math.nan
+
+def write_snapshot(path: str, rows: List[Dict[str, Any]]):
+    """Write `rows` (raw task mappings) to `path`, replacing any old snapshot atomically."""
+    heap = bytearray()
+    offsets: Dict[str, int] = {}
+    statuses: Dict[Any, int] = {}
+    priorities: Dict[Any, int] = {}
+    columns: Dict[str, array] = {name: array("q") for name in INT_FIELDS}
+    columns.update({name: array("d") for name in TIME_FIELDS.values()})
+    columns.update({"status": array("H"), "priority": array("H"), "completed": array("B")})
+    for name in TEXT_FIELDS:
+        columns[f"{name}_off"] = array("I")
+        columns[f"{name}_len"] = array("I")
+
+    for row in rows:
+        for name in INT_FIELDS:
+            value = row.get(name)
+            columns[name].append(NO_INT if value is None else value)
+        for name, column in TIME_FIELDS.items():
+            columns[column].append(_epoch(row.get(name)))
+        columns["status"].append(statuses.setdefault(row.get("status", "pending"), len(statuses)))
+        columns["priority"].append(priorities.setdefault(row.get("priority", "MEDIUM"), len(priorities)))
+        columns["completed"].append(bool(row.get("completed")))
+        for name in TEXT_FIELDS:
+            text = row.get(name)
+            if text is None:
+                columns[f"{name}_off"].append(0)
+                columns[f"{name}_len"].append(NO_TEXT)
+                continue
+            data = str(text).encode("utf-8")
+            if not data:
+                # Readers return "" for a zero length without touching the heap.
+                columns[f"{name}_off"].append(0)
+                columns[f"{name}_len"].append(0)
+                continue
+            offset = offsets.get(text)
+            if offset is None:
+                offset = offsets[text] = len(heap)
+                heap += data
+            columns[f"{name}_off"].append(offset)
+            columns[f"{name}_len"].append(len(data))
+
+    layout = {}
+    position = 0
+    for name, column in columns.items():
+        layout[name] = [column.typecode, position]
+        position = _align(position + len(column) * column.itemsize)
+    header = json.dumps({
+        "byteorder": sys.byteorder,
+        "statuses": [*statuses],
+        "priorities": [*priorities],
+        "columns": layout,
+        "heap": position,
+    }).encode("utf-8")
+    body_start = _align(PREFIX.size + len(header))
+
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp, "wb") as f:
+            f.write(PREFIX.pack(MAGIC, len(rows), len(header)))
+            f.write(header)
+            f.write(b"\0" * (body_start - PREFIX.size - len(header)))
+            for column in columns.values():
+                data = column.tobytes()
+                f.write(data)
+                f.write(b"\0" * (_align(len(data)) - len(data)))
+            f.write(heap)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        # A failed write (e.g. a full disk) must not leave a temp file in the config dir.
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+class Snapshot:
+    """A read-only, memory-mapped snapshot. Columns are zero-copy memoryviews."""
+
+    def __init__(self, path: str):
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self.count, header_len = PREFIX.unpack_from(self._mmap, 0)
+        if magic != MAGIC:
+            raise ValueError(f"Not a task snapshot: {path}")
+        header = json.loads(self._mmap[PREFIX.size:PREFIX.size + header_len])
+        if header["byteorder"] != sys.byteorder:
+            raise ValueError(f"Snapshot written on a {header['byteorder']}-endian machine: {path}")
+        self.path = path
+        self.statuses: List[str] = header["statuses"]
+        self.priorities: List[str] = header["priorities"]
+        body = _align(PREFIX.size + header_len)
+        self._view = view = memoryview(self._mmap)
+        self.columns: Dict[str, memoryview] = {}
+        for name, (typecode, offset) in header["columns"].items():
+            size = array(typecode).itemsize
+            start = body + offset
+            self.columns[name] = view[start:start + self.count * size].cast(typecode)
+        self._heap = body + header["heap"]
+        self._texts: Dict[int, str] = {}
+
+    @classmethod
+    def open(cls, path: str) -> Optional["Snapshot"]:
+        """The snapshot at `path`, or None if it is missing or unreadable."""
+        try:
+            return cls(path)
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def __len__(self) -> int:
+        return self.count
+
+    def text(self, name: str, index: int) -> Optional[str]:
+        length = self.columns[f"{name}_len"][index]
+        if length == NO_TEXT:
+            return None
+        if not length:
+            return ""
+        # Equal non-empty strings are stored once, so an offset always decodes to the same text.
+        offset = self.columns[f"{name}_off"][index]
+        text = self._texts.get(offset)
+        if text is None:
+            start = self._heap + offset
+            text = self._texts[offset] = self._mmap[start:start + length].decode("utf-8")
+        return text
+
+    def _int(self, name: str, index: int) -> Optional[int]:
+        value = self.columns[name][index]
+        return None if value == NO_INT else value
+
+    def row(self, index: int) -> Dict[str, Any]:
+        """Task `index` as the mapping the API returned (task fields only)."""
+        return {
+            "id": self._int("id", index),
+            "title": self.text("title", index),
+            "description": self.text("description", index),
+            "status": self.statuses[self.columns["status"][index]],
+            "due_date": self.text("due_date", index),
+            "priority": self.priorities[self.columns["priority"][index]],
+            "completed": bool(self.columns["completed"][index]),
+            "user_id": self._int("user_id", index),
+            "category_id": self._int("category_id", index),
+            "created_at": self.text("created_at", index),
+            "updated_at": self.text("updated_at", index),
+        }
+
+    def _texts_of(self, name: str) -> List[Optional[str]]:
+        cache, mm, heap = self._texts, self._mmap, self._heap
+        texts: List[Optional[str]] = []
+        append = texts.append
+        for offset, length in zip(self.columns[f"{name}_off"].tolist(), self.columns[f"{name}_len"].tolist()):
+            if length == NO_TEXT:
+                append(None)
+                continue
+            if not length:
+                append("")
+                continue
+            text = cache.get(offset)
+            if text is None:
+                text = cache[offset] = mm[heap + offset:heap + offset + length].decode("utf-8")
+            append(text)
+        return texts
+
+    def _ints_of(self, name: str) -> List[Optional[int]]:
+        return [None if value == NO_INT else value for value in self.columns[name].tolist()]
+
+    def rows(self) -> List[Dict[str, Any]]:
+        """Every task as a mapping, like `row`, converting whole columns at once."""
+        statuses, priorities = self.statuses, self.priorities
+        fields = zip(
+            self._ints_of("id"), self._texts_of("title"), self._texts_of("description"),
+            self.columns["status"].tolist(), self._texts_of("due_date"), self.columns["priority"].tolist(),
+            self.columns["completed"].tolist(), self._ints_of("user_id"), self._ints_of("category_id"),
+            self._texts_of("created_at"), self._texts_of("updated_at"),
+        )
+        return [
+            {"id": id_, "title": title, "description": description, "status": statuses[status],
+             "due_date": due_date, "priority": priorities[priority], "completed": bool(completed),
+             "user_id": user_id, "category_id": category_id, "created_at": created_at,
+             "updated_at": updated_at}
+            for (id_, title, description, status, due_date, priority, completed,
+                 user_id, category_id, created_at, updated_at) in fields
+        ]
+
+    def status_codes(self) -> List[int]:
+        """This snapshot's status numbers mapped to the process-wide STATUS_CODES."""
+        return [STATUS_CODES.code(value) for value in self.statuses]
+
+    def priority_codes(self) -> List[int]:
+        return [PRIORITY_CODES.code(value) for value in self.priorities]
+
+    def tasks(self) -> Iterator[Task]:
+        return (Task(row) for row in self.rows())
+
+    def close(self):
+        for column in self.columns.values():
+            column.release()
+        self.columns.clear()
+        self._view.release()
+        self._mmap.close()
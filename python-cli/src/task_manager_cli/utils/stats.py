@@ -0,0 +1,153 @@
+"""
+Task statistics for task-manager CLI
+This module counts tasks by status, priority, category, completion and due
+date in a single pass, or with NumPy column operations when it is installed.
+NumPy is imported on first use, so commands that never compute statistics do
+not pay for it at startup.
+"""
+
+import math
+from bisect import bisect_left
+from collections import Counter
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+from ..models import PRIORITY_CODES, STATUS_CODES, Task
+from .snapshot import NO_INT
+
+DAY = 86400.0
+DEFAULT_HORIZONS = (1, 7, 30)
+
+@lru_cache(maxsize=None)
+def _import_numpy():
+    """numpy, or None if it is not installed."""
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+def have_numpy() -> bool:
+    return _import_numpy() is not None
+
+def due_labels(horizons: Sequence[int]) -> List[str]:
+    """Due-date bucket names for open tasks, in bucket order."""
+    return (["overdue"] + [f"within {days} day{'s' if days != 1 else ''}" for days in horizons]
+            + ["later", "no due date"])
+
+def _result(total: int, completed: int, status: Dict[int, int], priority: Dict[int, int],
+            category: Dict[Optional[int], int], due: List[int], horizons: Sequence[int]) -> Dict[str, Any]:
+    return {
+        "total": total,
+        "completed": completed,
+        "open": total - completed,
+        "overdue": due[0],
+        "status": {STATUS_CODES.value(code): count for code, count in sorted(status.items()) if count},
+        "priority": {PRIORITY_CODES.value(code): count for code, count in sorted(priority.items()) if count},
+        "category": dict(sorted(category.items(), key=lambda item: (item[0] is None, item[0] or 0))),
+        "due": dict(zip(due_labels(horizons), due)),
+    }
+
+class StatsAggregator:
+    """Streaming counters: feed tasks one at a time with `add`, then read `result`.
+
+    Overdue and due buckets only count open tasks; a task is overdue when its
+    due date is before `now`, as for the backend's /tasks/overdue.
+    """
+
+    def __init__(self, now: float, horizons: Sequence[int] = DEFAULT_HORIZONS):
+        self.now = now
+        self.horizons = sorted(set(horizons))
+        self.edges = [now + days * DAY for days in self.horizons]
+        self.total = 0
+        self.completed = 0
+        self.status: Counter = Counter()
+        self.priority: Counter = Counter()
+        self.category: Counter = Counter()
+        self.due = [0] * (len(self.edges) + 3)
+
+    def add(self, task: Task):
+        self.total += 1
+        self.status[task.status_code] += 1
+        self.priority[task.priority_code] += 1
+        self.category[task.category_id] += 1
+        if task.completed:
+            self.completed += 1
+            return
+        due_date = task.due_date
+        if due_date is None:
+            self.due[-1] += 1
+            return
+        due = due_date.timestamp()
+        self.due[0 if due < self.now else 1 + bisect_left(self.edges, due)] += 1
+
+    def result(self) -> Dict[str, Any]:
+        return _result(self.total, self.completed, self.status, self.priority,
+                       self.category, self.due, self.horizons)
+
+def task_columns(tasks: Iterable[Task]) -> Dict[str, Any]:
+    """The columns `vectorized_stats` needs, as NumPy arrays (-1 / NaN for missing values)."""
+    np = _import_numpy()
+    status, priority, category, completed, due = [], [], [], [], []
+    for task in tasks:
+        status.append(task.status_code)
+        priority.append(task.priority_code)
+        category.append(-1 if task.category_id is None else task.category_id)
+        completed.append(bool(task.completed))
+        due.append(task.due_date.timestamp() if task.due_date else math.nan)
+    return {
+        "status_code": np.array(status, dtype=np.int32),
+        "priority_code": np.array(priority, dtype=np.int32),
+        "category_id": np.array(category, dtype=np.int64),
+        "completed": np.array(completed, dtype=bool),
+        "due": np.array(due, dtype=np.float64),
+    }
+
+def snapshot_columns(snapshot) -> Dict[str, Any]:
+    """`task_columns` read straight from a memory-mapped Snapshot (or TaskColumns), without building tasks."""
+    np = _import_numpy()
+    columns = snapshot.columns
+    category = np.frombuffer(columns["category_id"], dtype=np.int64)
+    return {
+        "status_code": np.asarray(snapshot.status_codes(), dtype=np.int32)[
+            np.frombuffer(columns["status"], dtype=np.uint16)],
+        "priority_code": np.asarray(snapshot.priority_codes(), dtype=np.int32)[
+            np.frombuffer(columns["priority"], dtype=np.uint16)],
+        "category_id": np.where(category == NO_INT, -1, category),
+        "completed": np.frombuffer(columns["completed"], dtype=np.uint8).astype(bool),
+        "due": np.frombuffer(columns["due"], dtype=np.float64),
+    }
+
+def vectorized_stats(columns: Dict[str, Any], now: float,
+                     horizons: Sequence[int] = DEFAULT_HORIZONS) -> Dict[str, Any]:
+    """Same result as StatsAggregator, computed over NumPy columns."""
+    np = _import_numpy()
+    horizons = sorted(set(horizons))
+    completed = columns["completed"]
+    status = np.bincount(columns["status_code"])
+    priority = np.bincount(columns["priority_code"])
+    ids, counts = np.unique(columns["category_id"], return_counts=True)
+    category = {None if i < 0 else int(i): int(n) for i, n in zip(ids, counts)}
+
+    open_due = columns["due"][~completed]
+    dated = open_due[~np.isnan(open_due)]
+    edges = np.array([now + days * DAY for days in horizons])
+    # side="left" puts a task due exactly on an edge in the earlier bucket, like bisect_left.
+    index = np.where(dated < now, 0, 1 + np.searchsorted(edges, dated, side="left"))
+    buckets = np.bincount(index, minlength=len(edges) + 2)
+    due = [int(n) for n in buckets] + [int(len(open_due) - len(dated))]
+    return _result(len(completed), int(completed.sum()), dict(enumerate(status.tolist())),
+                   dict(enumerate(priority.tolist())), category, due, horizons)
+
+def compute_stats(tasks: Iterable[Task], now: float, horizons: Sequence[int] = DEFAULT_HORIZONS,
+                  vectorize: Optional[bool] = None) -> Dict[str, Any]:
+    """Statistics for a task set, using NumPy when available unless `vectorize` is False."""
+    if vectorize is None:
+        vectorize = have_numpy()
+    if vectorize:
+        if not have_numpy():
+            raise RuntimeError("Vectorized statistics need NumPy: pip install numpy")
+        return vectorized_stats(task_columns(tasks), now, horizons)
+    aggregator = StatsAggregator(now, horizons)
+    for task in tasks:
+        aggregator.add(task)
+    return aggregator.result()
@@ -0,0 +1,155 @@
+"""
+Local task store for task-manager CLI
+This module keeps a per-profile SQLite copy of the task set, written by the
+sync engine and read by commands that can work from local data.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+from .config import config
+from .dates import parse_timestamp
+
+SCHEMA_VERSION = 2
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS tasks (
+    id INTEGER PRIMARY KEY,
+    updated_at TEXT,
+    due_at REAL,
+    completed INTEGER NOT NULL DEFAULT 0,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS tasks_due_at ON tasks (due_at);
+CREATE INDEX IF NOT EXISTS tasks_open_due_at ON tasks (completed, due_at);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+def _due_at(task: Dict[str, Any]) -> Optional[float]:
+    due = parse_timestamp(task.get("due_date"))
+    return due.timestamp() if due else None
+
+class TaskStore:
+    """Raw task payloads keyed by id, plus sync metadata, in one SQLite file."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.RLock()
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            if conn.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+                # The store is only a copy of the server's data: rebuild it on the next sync.
+                conn.executescript("DROP TABLE IF EXISTS tasks; DROP TABLE IF EXISTS meta;")
+                conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+            conn.executescript(SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    def exists(self) -> bool:
+        return os.path.exists(self.path)
+
+    def get_meta(self, key: str, default: Any = None) -> Any:
+        with self._lock:
+            row = self.conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return json.loads(row[0]) if row else default
+
+    def versions(self) -> Dict[int, Optional[str]]:
+        """Map of task id -> updated_at for every stored task."""
+        with self._lock:
+            return dict(self.conn.execute("SELECT id, updated_at FROM tasks"))
+
+    def count(self) -> int:
+        with self._lock:
+            return self.conn.execute("SELECT COUNT(*) FROM tasks").fetchone()[0]
+
+    def get(self, task_id: int) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self.conn.execute("SELECT data FROM tasks WHERE id = ?", (task_id,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def completion(self, task_ids: Iterable[int], batch: int = 500) -> Dict[int, bool]:
+        """Map of task id -> completed for those of `task_ids` that are stored."""
+        ids = [*task_ids]
+        states: Dict[int, bool] = {}
+        with self._lock:
+            # Batched to stay under SQLite's limit on bound parameters.
+            for start in range(0, len(ids), batch):
+                chunk = ids[start:start + batch]
+                rows = self.conn.execute(
+                    f"SELECT id, completed FROM tasks WHERE id IN ({', '.join('?' * len(chunk))})", chunk)
+                states.update((task_id, bool(completed)) for task_id, completed in rows)
+        return states
+
+    def all(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            rows = self.conn.execute("SELECT data FROM tasks ORDER BY id").fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def iter_open(self, batch: int = 1000) -> Iterator[Dict[str, Any]]:
+        """Open tasks one at a time, read from the database in batches."""
+        with self._lock:
+            cursor = self.conn.execute("SELECT data FROM tasks WHERE completed = 0")
+            rows = cursor.fetchmany(batch)
+            while rows:
+                for row in rows:
+                    yield json.loads(row[0])
+                rows = cursor.fetchmany(batch)
+
+    def due_between(self, start: float, end: float) -> List[Dict[str, Any]]:
+        """Tasks due in [start, end) (epoch seconds), by due date, using the due_at index."""
+        with self._lock:
+            rows = self.conn.execute(
+                "SELECT data FROM tasks WHERE due_at >= ? AND due_at < ? ORDER BY due_at, id", (start, end)
+            ).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def overdue(self, before: float) -> List[Dict[str, Any]]:
+        """Open tasks due before `before` (epoch seconds), oldest first."""
+        with self._lock:
+            rows = self.conn.execute(
+                "SELECT data FROM tasks WHERE completed = 0 AND due_at < ? ORDER BY due_at, id", (before,)
+            ).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def apply(self, upserts: Iterable[Dict[str, Any]] = (), deletes: Iterable[int] = (),
+              meta: Optional[Dict[str, Any]] = None):
+        """Upsert and delete tasks and update metadata in a single transaction."""
+        with self._lock, self.conn:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO tasks (id, updated_at, due_at, completed, data) VALUES (?, ?, ?, ?, ?)",
+                ((task["id"], task.get("updated_at"), _due_at(task), bool(task.get("completed")),
+                  json.dumps(task)) for task in upserts),
+            )
+            self.conn.executemany("DELETE FROM tasks WHERE id = ?", ((task_id,) for task_id in deletes))
+            for key, value in (meta or {}).items():
+                self.conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+                                  (key, json.dumps(value)))
+
+    def patch(self, task_id: int, fields: Dict[str, Any]) -> bool:
+        """Merge `fields` into a stored task after a mutation; False if it is not stored."""
+        with self._lock, self.conn:
+            row = self.conn.execute("SELECT data FROM tasks WHERE id = ?", (task_id,)).fetchone()
+            if row is None:
+                return False
+            task = dict(json.loads(row[0]), **fields)
+            self.conn.execute(
+                "UPDATE tasks SET updated_at = ?, due_at = ?, completed = ?, data = ? WHERE id = ?",
+                (task.get("updated_at"), _due_at(task), bool(task.get("completed")), json.dumps(task), task_id),
+            )
+        return True
+
+    def clear(self):
+        with self._lock, self.conn:
+            self.conn.execute("DELETE FROM tasks")
+            self.conn.execute("DELETE FROM meta")
+
+task_store = TaskStore(os.path.join(config.CONFIG_DIR, f"store-{config.API_PROFILE}.sqlite3"))
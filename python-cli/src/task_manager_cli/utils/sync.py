@@ -0,0 +1,201 @@
+"""
+Delta sync engine for task-manager CLI
+This module brings the local task store up to date with the server using an
+updated_at high-water mark, records counts and timings for `sync --status`,
+and rebuilds the memory-mapped snapshot that read-only commands load.
+"""
+
+import math
+import os
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional
+from urllib.parse import quote
+from rich.console import Console
+from .api import APIClient, APIError, api_client
+from .diff import diff_versions, versions
+from .config import config
+from .dates import parse_timestamp
+from .snapshot import Snapshot, write_snapshot
+from .store import TaskStore, task_store
+
+class SyncEngine:
+    """Syncs one TaskStore against one API client.
+
+    With a watermark, the engine asks for `GET /tasks?updated_since=<watermark>`
+    and applies the result as a delta: changed tasks are upserted and nothing
+    is deleted, because a filtered response cannot reveal deletions. If the
+    server rejects the filter with a 4xx, or ignores it (the response holds
+    tasks older than the watermark), that is recorded and syncs use the
+    unfiltered `GET /tasks` from then on. Only an unfiltered response is
+    diffed against the store by id to find deletions; `full=True`, or
+    `reconcile_interval` seconds since the last full sync, forces one.
+    """
+
+    def __init__(self, client: APIClient, store: TaskStore, snapshot_path: str,
+                 reconcile_interval: Optional[float] = None, max_age: Optional[float] = None):
+        self.client = client
+        self.store = store
+        self.snapshot_path = snapshot_path
+        self._reconcile_interval = reconcile_interval
+        self._max_age = max_age
+
+    @property
+    def reconcile_interval(self) -> float:
+        """Seconds between full reconciles, from API_SYNC_RECONCILE_INTERVAL unless given."""
+        if self._reconcile_interval is None:
+            self._reconcile_interval = config.setting("sync_reconcile_interval", 3600, float)
+        return self._reconcile_interval
+
+    @property
+    def max_age(self) -> float:
+        """Seconds a sync serves reads before they sync again, from API_SYNC_MAX_AGE unless given."""
+        if self._max_age is None:
+            self._max_age = config.setting("sync_max_age", 300, float)
+        return self._max_age
+
+    def sync(self, full: bool = False) -> Dict[str, Any]:
+        started = time.perf_counter()
+        reset = self.store.get_meta("base_url") not in (None, self.client.base_url)
+        if reset:
+            self.store.clear()
+        watermark = self.store.get_meta("watermark")
+        known = self.store.versions()
+        last_full = self.store.get_meta("last_full")
+        if last_full is None or time.time() - last_full >= self.reconcile_interval:
+            full = True
+        meta: Dict[str, Any] = {"base_url": self.client.base_url}
+
+        response = None
+        if watermark and known and not full and self.store.get_meta("filter_supported", True):
+            response = self._fetch_since(watermark)
+            if response is None:
+                meta["filter_supported"] = False
+            elif not all(_epoch(task.get("updated_at")) >= _epoch(watermark) for task in response):
+                # The server ignored the filter. Apply this response as a delta anyway and fetch
+                # unfiltered from now on; deletions only ever come from an unfiltered response.
+                meta["filter_supported"] = False
+
+        if response is not None:
+            mode = "delta"
+            # updated_since is inclusive, so tasks at the watermark come back unchanged.
+            upserts = [task for task in response if known.get(task["id"]) != task.get("updated_at")]
+            added = [task["id"] for task in upserts if task["id"] not in known]
+            changed = [task["id"] for task in upserts if task["id"] in known]
+            removed: List[int] = []
+        else:
+            mode = "full"
+            response = self.client.request("GET", "/tasks", memo=False) or []
+            diff = diff_versions(known, versions(response))
+            upserts = [task for task in response if task["id"] in diff.added or task["id"] in diff.changed]
+            added, changed, removed = sorted(diff.added), sorted(diff.changed), sorted(diff.removed)
+
+        # A delta only moves the watermark forward; a full fetch defines it.
+        stamps = [task["updated_at"] for task in response if task.get("updated_at")]
+        if mode == "delta":
+            stamps.append(watermark)
+        stats = {
+            "mode": mode,
+            "synced_at": datetime.now(timezone.utc).isoformat(),
+            "fetched": len(response),
+            "added": len(added),
+            "changed": len(changed),
+            "removed": len(removed),
+            "total": len(known) + len(added) - len(removed),
+        }
+        meta["watermark"] = max(stamps, key=_epoch) if stamps else None
+        if mode == "full":
+            meta["last_full"] = time.time()
+        self.store.apply(upserts, removed, meta=meta)
+        # A sync that changed nothing leaves the snapshot as it is.
+        if upserts or removed or reset or not os.path.exists(self.snapshot_path):
+            self.rebuild_snapshot()
+        # Timed last, so that writing the store and the snapshot is included.
+        stats["duration_ms"] = round((time.perf_counter() - started) * 1000, 3)
+        self.store.apply(meta={"last_sync": stats})
+        return stats
+
+    def _fetch_since(self, watermark: str) -> Optional[List[Dict[str, Any]]]:
+        """Tasks updated at or after `watermark`, or None if the server rejects the filter."""
+        try:
+            return self.client.request("GET", f"/tasks?updated_since={quote(watermark)}", memo=False) or []
+        except APIError as e:
+            # Auth failures and rate limiting would fail the unfiltered request too.
+            if e.status_code is None or not 400 <= e.status_code < 500 or e.status_code in (401, 403, 429):
+                raise
+            return None
+
+    def record(self, upserts: Iterable[Dict[str, Any]] = (), deletes: Iterable[int] = (),
+               patches: Optional[Dict[int, Dict[str, Any]]] = None):
+        """Apply a successful mutation to the synced store and snapshot, so reads before the next sync see it."""
+        if not self.synced():
+            return
+        self.store.apply(upserts, deletes)
+        for task_id, fields in (patches or {}).items():
+            self.store.patch(task_id, fields)
+        self.rebuild_snapshot()
+
+    def rebuild_snapshot(self):
+        """Rewrite the snapshot from the store; readers see the old or the new file, never a mix."""
+        write_snapshot(self.snapshot_path, self.store.all())
+
+    def snapshot(self) -> Optional[Snapshot]:
+        """The snapshot of the up-to-date local store, or None without a synced store."""
+        if self.local_store() is None:
+            return None
+        snapshot = Snapshot.open(self.snapshot_path)
+        if snapshot is None:
+            self.rebuild_snapshot()
+            snapshot = Snapshot.open(self.snapshot_path)
+        return snapshot
+
+    def synced(self) -> bool:
+        """Whether the store holds a completed sync for the client's base URL."""
+        return (self.store.exists() and self.store.get_meta("base_url") == self.client.base_url
+                and self.store.get_meta("last_sync") is not None)
+
+    def local_store(self) -> Optional[TaskStore]:
+        """The synced store, or None without one.
+
+        Reads are served from the store as it is; it is synced first only when
+        the last sync is older than `max_age`. If that sync cannot reach the
+        server the last synced copy is used, with a warning on stderr.
+        """
+        if not self.synced():
+            return None
+        synced_at = self.store.get_meta("last_sync")["synced_at"]
+        if time.time() - _epoch(synced_at) >= self.max_age:
+            try:
+                self.sync()
+            except APIError as e:
+                Console(stderr=True).print(
+                    f"[yellow]Warning:[/yellow] could not sync ({e}); showing tasks as of {synced_at}.")
+        return self.store
+
+    def task_rows(self) -> List[Dict[str, Any]]:
+        """Every task as a raw mapping, from the local snapshot when this profile has a store."""
+        snapshot = self.snapshot()
+        if snapshot is None:
+            return self.client.request("GET", "/tasks") or []
+        return snapshot.rows()
+
+    def status(self) -> Dict[str, Any]:
+        if not self.store.exists():
+            return {"path": self.store.path, "snapshot": None, "base_url": None, "watermark": None,
+                    "total": 0, "last_sync": None}
+        return {
+            "path": self.store.path,
+            "snapshot": self.snapshot_path if os.path.exists(self.snapshot_path) else None,
+            "base_url": self.store.get_meta("base_url"),
+            "watermark": self.store.get_meta("watermark"),
+            "total": self.store.count(),
+            "last_sync": self.store.get_meta("last_sync"),
+        }
+
+def _epoch(value: Optional[str]) -> float:
+    """Epoch seconds of a timestamp, or -inf if it is missing or invalid, for comparing updated_at values."""
+    parsed = parse_timestamp(value)
+    return parsed.timestamp() if parsed else -math.inf
+
+sync_engine = SyncEngine(api_client, task_store,
+                         os.path.join(config.CONFIG_DIR, f"snapshot-{config.API_PROFILE}.bin"))
@@ -0,0 +1,198 @@
+"""
+Request tracing for task-manager CLI
+This module records per-request phase timings, byte counts (and bytes saved
+by compression) and status.
+Traces are printed as a waterfall with --trace and/or appended as JSON lines
+to the file named by API_TRACE_FILE.
+"""
+
+import json
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from rich.console import Console
+from rich.table import Table
+from rich.text import Text
+from .config import config
+
+PHASE_STYLES = {
+    "throttle": "bright_magenta",
+    "prepare": "bright_blue",
+    "dns": "magenta",
+    "connect": "yellow",
+    "tls": "cyan",
+    "wait": "green",
+    "download": "blue",
+    "decode": "red",
+    "cache": "bright_green",
+    "backoff": "bright_red",
+    "models": "bright_black",
+    "render": "white",
+}
+
+class RequestTrace:
+    """Timings for one API request, or for a named client-side span."""
+
+    def __init__(self, label: str, method: Optional[str] = None):
+        self.label = label
+        self.method = method
+        self.timestamp = time.time()
+        self.start = time.perf_counter()
+        self.end: Optional[float] = None
+        self.phases: List[Tuple[str, float, float]] = []
+        self.status: Optional[int] = None
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.bytes_saved = 0
+        self.error: Optional[str] = None
+        self.extra: Dict[str, Any] = {}
+
+    @property
+    def last_end(self) -> float:
+        """End of the most recent phase, or the trace start."""
+        return self.phases[-1][2] if self.phases else self.start
+
+    @property
+    def duration(self) -> float:
+        return (self.end or time.perf_counter()) - self.start
+
+    def add_phase(self, name: str, start: float, end: Optional[float] = None):
+        self.phases.append((name, start, time.perf_counter() if end is None else end))
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_phase(name, start)
+
+    def to_dict(self) -> Dict[str, Any]:
+        phases: Dict[str, float] = {}
+        for name, start, end in self.phases:
+            phases[name] = round(phases.get(name, 0.0) + (end - start) * 1000, 3)
+        data = {
+            "ts": self.timestamp,
+            "label": self.label,
+            "method": self.method,
+            "status": self.status,
+            "duration_ms": round(self.duration * 1000, 3),
+            "bytes_sent": self.bytes_sent,
+            "bytes_received": self.bytes_received,
+            "bytes_saved": self.bytes_saved,
+            "phases": phases,
+            "error": self.error,
+        }
+        data.update(self.extra)
+        return data
+
+class Tracer:
+    """Collects request traces when --trace or API_TRACE_FILE is active."""
+
+    def __init__(self, path: Optional[str] = None):
+        self.enabled = False
+        self.path = path
+        self.traces: List[RequestTrace] = []
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    @property
+    def active(self) -> bool:
+        return self.enabled or bool(self.path)
+
+    def start(self, label: str, method: Optional[str] = None) -> RequestTrace:
+        trace = RequestTrace(label, method)
+        if self.active:
+            self._local.current = trace
+        return trace
+
+    def current(self) -> Optional[RequestTrace]:
+        """The trace of the request running on this thread, if tracing is active."""
+        return getattr(self._local, "current", None)
+
+    def finish(self, trace: RequestTrace):
+        trace.end = time.perf_counter()
+        if self.current() is trace:
+            self._local.current = None
+        if not self.active:
+            return
+        with self._lock:
+            if self.enabled:
+                self.traces.append(trace)
+            if self.path:
+                with open(self.path, "a") as f:
+                    f.write(json.dumps(trace.to_dict()) + "\n")
+
+    @contextmanager
+    def span(self, name: str) -> Iterator[None]:
+        """Time a client-side step such as building models or rendering."""
+        if not self.active:
+            yield
+            return
+        trace = RequestTrace(name)
+        try:
+            with trace.phase(name):
+                yield
+        finally:
+            self.finish(trace)
+
+    def print_waterfall(self, console: Console):
+        if not self.traces:
+            return
+        width = max(20, console.width - 70)
+        origin = min(trace.start for trace in self.traces)
+        total = max(trace.end for trace in self.traces) - origin or 1e-9
+        scale = width / total
+
+        table = Table(title="[bold cyan]Request trace[/bold cyan]")
+        table.add_column("#", justify="right", no_wrap=True)
+        table.add_column("Request", no_wrap=True, max_width=24)
+        table.add_column("Status", justify="right", no_wrap=True)
+        table.add_column("Sent", justify="right", no_wrap=True)
+        table.add_column("Recv", justify="right", no_wrap=True)
+        table.add_column("ms", justify="right", no_wrap=True)
+        show_circuit = any(trace.extra.get("circuit", "closed") != "closed" for trace in self.traces)
+        if show_circuit:
+            table.add_column("Circuit", no_wrap=True)
+        saved = sum(trace.bytes_saved for trace in self.traces)
+        if saved:
+            table.add_column("Saved", justify="right", no_wrap=True)
+            table.caption = f"Compression saved {saved} bytes"
+        table.add_column("Waterfall", no_wrap=True)
+        for number, trace in enumerate(self.traces, 1):
+            bar = Text()
+            for name, start, end in trace.phases:
+                first = min(max(int((start - origin) * scale), len(bar)), width - 1)
+                last = min(max(first + 1, int((end - origin) * scale)), width)
+                if first >= last:
+                    continue
+                bar.append(" " * (first - len(bar)))
+                bar.append("█" * (last - first), style=PHASE_STYLES.get(name, "white"))
+            label = f"{trace.method} {trace.label}" if trace.method else f"[dim]{trace.label}[/dim]"
+            status = trace.error and "[red]ERR[/red]" or str(trace.status or "-")
+            if trace.extra.get("memo"):
+                status = f"[dim]memo {trace.extra['memo']}[/dim]"
+            elif trace.extra.get("cache") in ("fresh", "revalidated"):
+                status = f"{status} [dim]{trace.extra['cache']}[/dim]"
+            row = [
+                str(number),
+                label,
+                status,
+                str(trace.bytes_sent) if trace.method else "",
+                str(trace.bytes_received) if trace.method else "",
+                f"{trace.duration * 1000:.1f}",
+            ]
+            if show_circuit:
+                row.append(trace.extra.get("circuit", ""))
+            if saved:
+                row.append(str(trace.bytes_saved) if trace.method else "")
+            table.add_row(*row, bar)
+        console.print(table)
+        legend = Text()
+        for name, style in PHASE_STYLES.items():
+            legend.append("█ ", style=style)
+            legend.append(f"{name}  ")
+        console.print(legend)
+
+tracer = Tracer(config.API_TRACE_FILE)
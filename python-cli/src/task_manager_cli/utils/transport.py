@@ -0,0 +1,292 @@
+"""
+HTTP transports for task-manager CLI
+This module provides the requests adapters mounted on the API client session.
+"""
+
+import os
+import socket
+import ssl
+import threading
+import time
+from typing import TYPE_CHECKING, Callable, Dict, Iterator, Optional, Tuple
+from urllib.parse import unquote, urlsplit
+import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.exceptions import NewConnectionError
+from urllib3.util.timeout import Timeout
+from .trace import RequestTrace, tracer
+
+if TYPE_CHECKING:
+    import httpx
+
+class _TracedConnectionMixin:
+    """Split connection setup into dns and connect phases on the current trace."""
+
+    def _new_conn(self):
+        trace = tracer.current()
+        if trace is None:
+            return super()._new_conn()
+        start = time.perf_counter()
+        try:
+            addresses = socket.getaddrinfo(self._dns_host, self.port, 0, socket.SOCK_STREAM)
+        except OSError:
+            # Let urllib3 resolve again and raise its usual error.
+            return super()._new_conn()
+        trace.add_phase("dns", start)
+        start = time.perf_counter()
+        host = self._dns_host
+        error = None
+        try:
+            for address in addresses:
+                self._dns_host = address[4][0]
+                try:
+                    sock = super()._new_conn()
+                except NewConnectionError as e:
+                    error = e
+                    continue
+                trace.add_phase("connect", start)
+                return sock
+        finally:
+            self._dns_host = host
+        raise error
+
+class TracedHTTPConnection(_TracedConnectionMixin, HTTPConnection):
+    pass
+
+class TracedHTTPSConnection(_TracedConnectionMixin, HTTPSConnection):
+    def connect(self):
+        super().connect()
+        trace = tracer.current()
+        if trace is not None and trace.phases and trace.phases[-1][0] == "connect":
+            trace.add_phase("tls", trace.last_end)
+
+class TracedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = TracedHTTPConnection
+
+class TracedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = TracedHTTPSConnection
+
+class TracingAdapter(HTTPAdapter):
+    """HTTP/1.1 connection pool whose new connections report to the tracer."""
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": TracedHTTPConnectionPool,
+            "https": TracedHTTPSConnectionPool,
+        }
+
+class UnixHTTPConnection(HTTPConnection):
+    """HTTP/1.1 over a Unix domain socket at `socket_path`."""
+
+    def __init__(self, *args, socket_path: str, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.socket_path = socket_path
+
+    def _new_conn(self) -> socket.socket:
+        start = time.perf_counter()
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            sock.settimeout(Timeout.resolve_default_timeout(self.timeout))
+            sock.connect(self.socket_path)
+        except OSError as e:
+            sock.close()
+            raise NewConnectionError(self, f"Failed to connect to {self.socket_path}: {e}") from e
+        trace = tracer.current()
+        if trace is not None:
+            trace.add_phase("connect", start)
+        return sock
+
+class UnixHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = UnixHTTPConnection
+
+class UnixSocketAdapter(HTTPAdapter):
+    """Pooled HTTP over Unix domain sockets, for http+unix:// URLs.
+
+    The socket path is the URL's host, percent-encoded, as in
+    http+unix://%2Frun%2Ftask-api.sock/tasks. Each socket path gets its own
+    keep-alive pool; proxies never apply.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._unix_pools: Dict[str, UnixHTTPConnectionPool] = {}
+        self._unix_lock = threading.Lock()
+
+    def _unix_pool(self, url: str) -> UnixHTTPConnectionPool:
+        socket_path = unquote(urlsplit(url).netloc)
+        with self._unix_lock:
+            pool = self._unix_pools.get(socket_path)
+            if pool is None:
+                pool = self._unix_pools[socket_path] = UnixHTTPConnectionPool(
+                    "localhost", maxsize=self._pool_maxsize, block=self._pool_block, socket_path=socket_path)
+            return pool
+
+    def get_connection_with_tls_context(self, request, verify, proxies=None, cert=None):
+        return self._unix_pool(request.url)
+
+    def get_connection(self, url, proxies=None):
+        return self._unix_pool(url)
+
+    def request_url(self, request, proxies) -> str:
+        return request.path_url
+
+    def close(self):
+        super().close()
+        with self._unix_lock:
+            for pool in self._unix_pools.values():
+                pool.close()
+            self._unix_pools.clear()
+
+# Connection-specific headers are not allowed in HTTP/2 requests.
+_HOP_BY_HOP = {"connection", "keep-alive", "proxy-connection", "transfer-encoding", "upgrade"}
+# httpcore trace events that match the phases TracingAdapter records.
+_H2_PHASES = {"connection.connect_tcp": "connect", "connection.start_tls": "tls"}
+
+def _import_httpx():
+    """httpx, imported on first use so that HTTP/1.1 runs do not pay for it at startup."""
+    try:
+        import h2  # noqa: F401  (httpx needs it for http2=True)
+        import httpx
+    except ImportError:
+        raise requests.exceptions.RequestException(
+            "HTTP/2 needs httpx with h2: pip install 'taskmanager-cli[http2]'")
+    return httpx
+
+def _ssl_context(verify, cert) -> ssl.SSLContext:
+    """The TLS settings HTTPAdapter derives from requests' `verify` and `cert` arguments."""
+    if verify is False:
+        context = ssl.create_default_context()
+        context.check_hostname = False
+        context.verify_mode = ssl.CERT_NONE
+    else:
+        bundle = verify if isinstance(verify, str) else requests.utils.DEFAULT_CA_BUNDLE_PATH
+        if not os.path.exists(bundle):
+            raise OSError(f"Could not find a suitable TLS CA certificate bundle, invalid path: {bundle}")
+        if os.path.isdir(bundle):
+            context = ssl.create_default_context(capath=bundle)
+        else:
+            context = ssl.create_default_context(cafile=bundle)
+    if cert:
+        certfile, keyfile = cert if isinstance(cert, tuple) else (cert, None)
+        context.load_cert_chain(certfile, keyfile)
+    return context
+
+def _trace_hook(trace: RequestTrace) -> Callable[[str, Dict], None]:
+    starts: Dict[str, float] = {}
+
+    def hook(event: str, info: Dict):
+        name, _, stage = event.rpartition(".")
+        if name not in _H2_PHASES:
+            return
+        if stage == "started":
+            starts[name] = time.perf_counter()
+        elif stage == "complete" and name in starts:
+            trace.add_phase(_H2_PHASES[name], starts.pop(name))
+    return hook
+
+class _H2Body:
+    """The `raw` of a requests.Response read from an httpx response, so the body can still be streamed."""
+
+    def __init__(self, response: "httpx.Response"):
+        self._response = response
+
+    def stream(self, chunk_size: int, decode_content: bool = True) -> Iterator[bytes]:
+        httpx = _import_httpx()
+        # Mapped like the errors requests raises while reading a urllib3 body.
+        try:
+            yield from self._response.iter_bytes(chunk_size)
+        except httpx.TimeoutException as e:
+            raise requests.exceptions.ConnectionError(e)
+        except httpx.DecodingError as e:
+            raise requests.exceptions.ContentDecodingError(e)
+        except httpx.HTTPError as e:
+            raise requests.exceptions.ChunkedEncodingError(e)
+        finally:
+            self._response.close()
+
+    def tell(self) -> int:
+        """Bytes read off the connection so far, before content decoding, like urllib3's tell()."""
+        return self._response.num_bytes_downloaded
+
+    def close(self):
+        self._response.close()
+
+class HTTP2Adapter(BaseAdapter):
+    """Sends requests through one httpx HTTP/2 client, so concurrent requests share a connection.
+
+    https:// negotiates HTTP/2 with ALPN and falls back to HTTP/1.1. With
+    `prior_knowledge`, cleartext http:// speaks HTTP/2 (h2c) from the start.
+    httpx errors are raised as the matching requests exceptions, so callers
+    handle failures exactly as with TracingAdapter. The session's `verify`,
+    `cert` and proxies (including REQUESTS_CA_BUNDLE and HTTPS_PROXY, which
+    requests has already resolved) select the client, one per combination.
+    """
+
+    def __init__(self, prior_knowledge: bool = False, max_connections: int = 10):
+        super().__init__()
+        self.prior_knowledge = prior_knowledge
+        self.max_connections = max_connections
+        self._clients: Dict[Tuple, "httpx.Client"] = {}
+        self._lock = threading.Lock()
+
+    def client(self, verify=True, cert=None, proxy: Optional[str] = None) -> "httpx.Client":
+        key = (verify, cert, proxy)
+        client = self._clients.get(key)
+        if client is None:
+            httpx = _import_httpx()
+            with self._lock:
+                client = self._clients.get(key)
+                if client is None:
+                    client = self._clients[key] = httpx.Client(
+                        http1=not self.prior_knowledge, http2=True, verify=_ssl_context(verify, cert),
+                        proxy=proxy, trust_env=False,
+                        limits=httpx.Limits(max_connections=self.max_connections))
+        return client
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        connect, read = timeout if isinstance(timeout, tuple) else (timeout, timeout)
+        httpx = _import_httpx()
+        try:
+            client = self.client(verify, cert, requests.utils.select_proxy(request.url, proxies or {}))
+        except OSError as e:
+            raise requests.exceptions.RequestException(e, request=request)
+        trace = tracer.current()
+        extensions = {"trace": _trace_hook(trace)} if trace is not None else None
+        headers = {name: value for name, value in request.headers.items() if name.lower() not in _HOP_BY_HOP}
+        try:
+            outgoing = client.build_request(
+                request.method, request.url, headers=headers, content=request.body,
+                timeout=httpx.Timeout(read, connect=connect), extensions=extensions)
+            response = client.send(outgoing, stream=True)
+        except httpx.ConnectTimeout as e:
+            raise requests.exceptions.ConnectTimeout(e, request=request)
+        except httpx.TimeoutException as e:
+            raise requests.exceptions.Timeout(e, request=request)
+        except (httpx.NetworkError, httpx.RemoteProtocolError) as e:
+            raise requests.exceptions.ConnectionError(e, request=request)
+        except httpx.HTTPError as e:
+            raise requests.exceptions.RequestException(e, request=request)
+        if trace is not None:
+            trace.extra["http"] = response.http_version
+        result = requests.Response()
+        result.status_code = response.status_code
+        result.reason = response.reason_phrase
+        result.headers = CaseInsensitiveDict(response.headers.items())
+        result.url = request.url
+        result.request = request
+        result.connection = self
+        result.encoding = requests.utils.get_encoding_from_headers(result.headers)
+        result.raw = _H2Body(response)
+        if not stream:
+            result.content  # read now, as HTTPAdapter does
+        return result
+
+    def close(self):
+        with self._lock:
+            for client in self._clients.values():
+                client.close()
+            self._clients.clear()
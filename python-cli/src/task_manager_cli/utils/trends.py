@@ -0,0 +1,125 @@
+"""
+Task trends for task-manager CLI
+This module builds created/completed/overdue time series and a burndown of
+open tasks from task timestamps, by sorting timestamp columns once and
+counting each bucket with binary searches.
+"""
+
+import csv
+import time
+from bisect import bisect_left
+from datetime import date, timedelta
+from enum import Enum
+from typing import IO, Dict, Iterable, List, NamedTuple, Optional
+from ..models import Task
+
+DAY = 86400
+
+class Bucket(str, Enum):
+    DAY = "day"
+    WEEK = "week"
+
+class TrendRow(NamedTuple):
+    start: date
+    created: int
+    completed: int
+    overdue: int
+    open: int
+
+def trend_columns(tasks: Iterable[Task]) -> Dict[str, List[float]]:
+    """Sorted timestamp columns for `compute_trends`.
+
+    The API has no completion timestamp, so a completed task's `updated_at`
+    is used as its completion time.
+    """
+    created: List[float] = []
+    done: List[float] = []
+    due: List[float] = []
+    due_done: List[float] = []
+    for task in tasks:
+        created_at = task.created_at.timestamp() if task.created_at else None
+        if created_at is not None:
+            created.append(created_at)
+        done_at = None
+        if task.completed:
+            done_at = (task.updated_at.timestamp() if task.updated_at else created_at)
+            if done_at is not None:
+                done.append(done_at)
+        if task.due_date:
+            due_at = task.due_date.timestamp()
+            due.append(due_at)
+            if done_at is not None:
+                # Overdue until done: not overdue at t once both due and done are before t.
+                due_done.append(max(due_at, done_at))
+    for column in (created, done, due, due_done):
+        column.sort()
+    return {"created": created, "done": done, "due": due, "due_done": due_done}
+
+def snapshot_trend_columns(snapshot) -> Dict[str, List[float]]:
+    """`trend_columns` read from a Snapshot's (or TaskColumns') timestamp columns, without parsing dates."""
+    created: List[float] = []
+    done: List[float] = []
+    due: List[float] = []
+    due_done: List[float] = []
+    columns = snapshot.columns
+    for created_at, updated_at, due_at, completed in zip(
+            columns["created"].tolist(), columns["updated"].tolist(),
+            columns["due"].tolist(), columns["completed"].tolist()):
+        # NaN marks a missing timestamp and is the only value not equal to itself.
+        if created_at == created_at:
+            created.append(created_at)
+        done_at = None
+        if completed:
+            done_at = updated_at if updated_at == updated_at else created_at
+            if done_at == done_at:
+                done.append(done_at)
+            else:
+                done_at = None
+        if due_at == due_at:
+            due.append(due_at)
+            if done_at is not None:
+                due_done.append(max(due_at, done_at))
+    for column in (created, done, due, due_done):
+        column.sort()
+    return {"created": created, "done": done, "due": due, "due_done": due_done}
+
+def _utc_offset(now: float) -> int:
+    return time.localtime(now).tm_gmtoff
+
+def compute_trends(columns: Dict[str, List[float]], bucket: Bucket = Bucket.DAY,
+                   now: Optional[float] = None) -> List[TrendRow]:
+    """One row per local day or week (weeks start on Monday) up to now.
+
+    `overdue` and `open` are the counts at the end of each bucket (or now, for
+    the current one); `open` is the burndown of tasks created but not completed.
+    """
+    now = time.time() if now is None else now
+    created, done, due, due_done = columns["created"], columns["done"], columns["due"], columns["due_done"]
+    starts = [column[0] for column in (created, done) if column]
+    if not starts:
+        return []
+    offset = _utc_offset(now)
+    size = DAY * (7 if bucket == Bucket.WEEK else 1)
+    # Day 0 (1970-01-01) is a Thursday; shifting by 3 days aligns weeks to Monday.
+    shift = 3 * DAY if bucket == Bucket.WEEK else 0
+    first = (int(min(starts)) + offset + shift) // size * size - shift - offset
+    rows = []
+    start = first
+    while start <= now:
+        end = start + size
+        at = min(end, now)
+        rows.append(TrendRow(
+            start=date(1970, 1, 1) + timedelta(seconds=start + offset),
+            created=bisect_left(created, end) - bisect_left(created, start),
+            completed=bisect_left(done, end) - bisect_left(done, start),
+            overdue=bisect_left(due, at) - bisect_left(due_done, at),
+            open=bisect_left(created, at) - bisect_left(done, at),
+        ))
+        start = end
+    return rows
+
+def write_csv(rows: Iterable[TrendRow], file: IO[str]):
+    writer = csv.writer(file)
+    writer.writerow(TrendRow._fields)
+    for row in rows:
+        writer.writerow([row.start.isoformat(), *row[1:]])
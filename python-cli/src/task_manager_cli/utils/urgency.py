@@ -0,0 +1,50 @@
+"""
+Task urgency for task-manager CLI
+This module scores open tasks by priority, due date and age and picks the
+most urgent ones with a bounded heap.
+"""
+
+import heapq
+import math
+from typing import Iterable, List, NamedTuple, Tuple
+from ..models import PRIORITY_CODES, Priority, Task
+from .config import config
+
+DAY = 86400.0
+# Due-date pressure doubles every DUE_HALF_LIFE days closer (or more overdue), up to DUE_CAP.
+DUE_HALF_LIFE = 7.0
+DUE_CAP = 4.0
+AGE_FULL = 30.0
+# Capping the exponent rather than the power keeps long-overdue tasks from overflowing float.
+_DUE_EXPONENT_CAP = math.log2(DUE_CAP)
+
+PRIORITY_RANK = {PRIORITY_CODES.code(Priority.LOW): 0.0,
+                 PRIORITY_CODES.code(Priority.MEDIUM): 0.5,
+                 PRIORITY_CODES.code(Priority.HIGH): 1.0}
+
+class UrgencyWeights(NamedTuple):
+    priority: float = 1.0
+    due: float = 2.0
+    age: float = 0.5
+
+def urgency_weights() -> UrgencyWeights:
+    """Weights from API_URGENCY_PRIORITY/DUE/AGE or the active profile."""
+    defaults = UrgencyWeights()
+    return UrgencyWeights(*(config.setting(f"urgency_{name}", getattr(defaults, name), float)
+                            for name in UrgencyWeights._fields))
+
+def urgency(task: Task, now: float, weights: UrgencyWeights) -> float:
+    """Weighted sum of priority (0-1), due-date pressure (0-4) and age (0-1)."""
+    score = weights.priority * PRIORITY_RANK.get(task.priority_code, 0.5)
+    if task.due_date is not None:
+        days_left = (task.due_date.timestamp() - now) / DAY
+        score += weights.due * 2 ** min(-days_left / DUE_HALF_LIFE, _DUE_EXPONENT_CAP)
+    if task.created_at is not None:
+        score += weights.age * min(max(now - task.created_at.timestamp(), 0) / DAY / AGE_FULL, 1.0)
+    return score
+
+def most_urgent(tasks: Iterable[Task], count: int, now: float,
+                weights: UrgencyWeights) -> List[Tuple[float, Task]]:
+    """The `count` most urgent open tasks, highest first, in O(n log count) time and O(count) memory."""
+    scored = ((urgency(task, now, weights), task) for task in tasks if not task.completed)
+    return heapq.nlargest(count, scored, key=lambda item: item[0])
@@ -0,0 +1,20 @@
+import pytest
+from fixtures import MockServer
+from task_manager_cli.utils.api import APIClient
+from task_manager_cli.utils.retry import RetryPolicy
+
+@pytest.fixture
+def server():
+    with MockServer(task_count=3) as server:
+        yield server
+
+@pytest.fixture
+def client(server):
+    # No disk cache or throttling, and short backoffs, so only the behaviour under test applies.
+    client = APIClient()
+    client.base_url = server.base_url
+    client.cache = None
+    client.limiter = None
+    client.retry = RetryPolicy(retries=3, backoff=0.01, budget=5)
+    yield client
+    client.session.close()
@@ -0,0 +1,78 @@
+import time
+import pytest
+from task_manager_cli.utils.api import APIError
+from task_manager_cli.utils.breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker, get_breaker
+
+UNAVAILABLE = (503, {}, b'{"message": "Service Unavailable"}')
+
+def test_opens_after_threshold_failures():
+    breaker = CircuitBreaker(threshold=3, reset_timeout=60)
+    for _ in range(2):
+        breaker.record_failure()
+    assert breaker.state == CLOSED and breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == OPEN
+    assert not breaker.allow()
+
+def test_success_resets_the_failure_count():
+    breaker = CircuitBreaker(threshold=2, reset_timeout=60)
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+    assert breaker.state == CLOSED
+
+def test_half_open_lets_one_probe_through():
+    breaker = CircuitBreaker(threshold=1, reset_timeout=0.05)
+    breaker.record_failure()
+    time.sleep(0.06)
+    assert breaker.state == HALF_OPEN
+    assert breaker.allow()
+    assert not breaker.allow()
+    breaker.record_success()
+    assert breaker.state == CLOSED and breaker.allow()
+
+def test_failed_probe_reopens():
+    breaker = CircuitBreaker(threshold=1, reset_timeout=0.05)
+    breaker.record_failure()
+    time.sleep(0.06)
+    assert breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == OPEN
+    assert not breaker.allow()
+
+def test_release_ends_an_unfinished_probe():
+    breaker = CircuitBreaker(threshold=1, reset_timeout=0.05)
+    breaker.record_failure()
+    time.sleep(0.06)
+    assert breaker.allow()
+    breaker.release()
+    assert breaker.allow()
+
+def test_client_fails_fast_while_open(server, client):
+    breaker = get_breaker(client.base_url, 5, 30)
+    server.script.extend([UNAVAILABLE] * 5)
+    with pytest.raises(APIError):
+        client.request("GET", "/tasks", memo=False)
+    client.retry.retries = 0
+    with pytest.raises(APIError):
+        client.request("GET", "/tasks", memo=False)
+    assert breaker.state == OPEN
+    with pytest.raises(APIError, match="is failing"):
+        client.request("GET", "/tasks", memo=False)
+    assert len(server.log) == 5
+
+def test_interrupted_probe_does_not_keep_the_circuit_open(server, client, monkeypatch):
+    breaker = get_breaker(client.base_url)
+    breaker.reset_timeout = 0.05
+    for _ in range(breaker.threshold):
+        breaker.record_failure()
+    time.sleep(0.06)
+
+    def interrupted(*args):
+        raise KeyboardInterrupt
+    with monkeypatch.context() as patch:
+        patch.setattr(client, "_send", interrupted)
+        with pytest.raises(KeyboardInterrupt):
+            client.request("GET", "/tasks", memo=False)
+    assert len(client.request("GET", "/tasks", memo=False)) == 3
+    assert breaker.state == CLOSED
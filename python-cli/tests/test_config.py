@@ -0,0 +1,29 @@
+import pytest
+from task_manager_cli.utils.config import Config, ConfigError
+
+@pytest.fixture
+def config(tmp_path, monkeypatch):
+    monkeypatch.setattr(Config, "CONFIG_DIR", str(tmp_path))
+    monkeypatch.setattr(Config, "API_PROFILE", "default")
+    return Config()
+
+def test_environment_overrides_profile(config, tmp_path, monkeypatch):
+    (tmp_path / "profiles.json").write_text('{"default": {"rate_limit": 2, "memo_ttl": 5}}')
+    monkeypatch.setenv("API_RATE_LIMIT", "7")
+    assert config.setting("rate_limit", 0, float) == 7
+    assert config.setting("memo_ttl", 10, float) == 5
+    assert config.setting("cache_ttl", 0, float) == 0
+
+def test_bad_value_raises_config_error(config, monkeypatch):
+    monkeypatch.setenv("API_RATE_LIMIT", "abc")
+    with pytest.raises(ConfigError, match="API_RATE_LIMIT"):
+        config.setting("rate_limit", 0, float)
+    monkeypatch.setenv("API_TIMEOUT", "soon")
+    with pytest.raises(ConfigError, match="API_TIMEOUT"):
+        config.API_TIMEOUT
+
+@pytest.mark.parametrize("content", ["{bad", "[]", '{"default": 1}'])
+def test_bad_profiles_file_raises_config_error(config, tmp_path, content):
+    (tmp_path / "profiles.json").write_text(content)
+    with pytest.raises(ConfigError, match="Invalid profiles file"):
+        config.profile
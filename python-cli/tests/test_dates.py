@@ -0,0 +1,59 @@
+from datetime import datetime, timedelta, timezone
+import pytest
+from task_manager_cli.utils import dates
+from task_manager_cli.utils.dates import parse_timestamp
+
+IST = timezone(timedelta(hours=5, minutes=30))
+
+CASES = [
+    ("2024-03-05T09:30:00Z", datetime(2024, 3, 5, 9, 30, tzinfo=timezone.utc)),
+    ("2024-03-05T09:30:00.123Z", datetime(2024, 3, 5, 9, 30, 0, 123000, tzinfo=timezone.utc)),
+    ("2024-03-05t09:30:00z", datetime(2024, 3, 5, 9, 30, tzinfo=timezone.utc)),
+    ("2024-03-05T09:30:00+05:30", datetime(2024, 3, 5, 9, 30, tzinfo=IST)),
+    ("2024-03-05T09:30:00+0530", datetime(2024, 3, 5, 9, 30, tzinfo=IST)),
+    ("2024-03-05T09:30:00-02", datetime(2024, 3, 5, 9, 30, tzinfo=timezone(timedelta(hours=-2)))),
+    # .NET and PostgreSQL send more digits than datetime keeps; they are truncated to microseconds.
+    ("2024-03-05T09:30:00.1234567Z", datetime(2024, 3, 5, 9, 30, 0, 123456, tzinfo=timezone.utc)),
+    ("2024-03-05 09:30:00.5", datetime(2024, 3, 5, 9, 30, 0, 500000)),
+    ("2024-03-05T09:30", datetime(2024, 3, 5, 9, 30)),
+    ("2024-03-05", datetime(2024, 3, 5)),
+]
+
+INVALID = ["", None, "garbage", "2024-13-01", "2024-02-30T00:00:00Z", "2024-03-05T25:00:00Z", 20240305,
+           ["2024-03-05"], {"date": "2024-03-05"}]
+
+@pytest.fixture
+def legacy_fromisoformat(monkeypatch):
+    """Make the module's datetime.fromisoformat reject everything, so parsing takes the regex path
+    that Python 3.8-3.10 use for inputs their fromisoformat does not accept."""
+    class LegacyDatetime(datetime):
+        @classmethod
+        def fromisoformat(cls, value):
+            raise ValueError(value)
+    dates._parse_iso.cache_clear()
+    monkeypatch.setattr(dates, "datetime", LegacyDatetime)
+    yield
+    dates._parse_iso.cache_clear()
+
+@pytest.mark.parametrize("value, expected", CASES)
+def test_parse(value, expected):
+    parsed = parse_timestamp(value)
+    assert parsed == expected
+    assert parsed.utcoffset() == expected.utcoffset()
+
+@pytest.mark.parametrize("value", INVALID)
+def test_invalid_returns_none(value):
+    assert parse_timestamp(value) is None
+
+@pytest.mark.parametrize("value, expected", CASES)
+def test_regex_fallback(legacy_fromisoformat, value, expected):
+    parsed = parse_timestamp(value)
+    assert parsed == expected
+    assert parsed.utcoffset() == expected.utcoffset()
+
+@pytest.mark.parametrize("value", INVALID)
+def test_regex_fallback_invalid_returns_none(legacy_fromisoformat, value):
+    assert parse_timestamp(value) is None
+
+def test_results_are_memoized():
+    assert parse_timestamp("2024-03-05T09:30:00Z") is parse_timestamp("2024-03-05T09:30:00Z")
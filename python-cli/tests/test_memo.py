@@ -0,0 +1,92 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+from task_manager_cli.utils.memo import HIT, MISS, SHARED, Memo
+
+KEY = ("GET", "http://api/tasks", None)
+
+def test_hit_within_ttl_and_miss_after():
+    memo = Memo(ttl=0.05)
+    calls = []
+    fetch = lambda: calls.append(1) or len(calls)
+    assert memo.call(KEY, fetch) == (1, MISS)
+    assert memo.call(KEY, fetch) == (1, HIT)
+    time.sleep(0.06)
+    assert memo.call(KEY, fetch) == (2, MISS)
+
+def test_lru_bound():
+    memo = Memo(ttl=60, max_entries=2)
+    for url in ("a", "b", "c"):
+        memo.call(("GET", url), lambda: url)
+    assert memo.call(("GET", "a"), lambda: "again") == ("again", MISS)
+    assert memo.call(("GET", "c"), lambda: "again") == ("c", HIT)
+
+def test_invalidate_drops_matching_urls():
+    memo = Memo(ttl=60)
+    memo.call(KEY, lambda: 1)
+    memo.call(("GET", "http://api/categories", None), lambda: 2)
+    memo.invalidate(["http://api/tasks"])
+    assert memo.call(KEY, lambda: 3) == (3, MISS)
+    assert memo.call(("GET", "http://api/categories", None), lambda: 4) == (2, HIT)
+
+def test_concurrent_calls_share_one_fetch():
+    memo = Memo(ttl=0)
+    release = threading.Event()
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        release.wait(5)
+        return "tasks"
+    with ThreadPoolExecutor(max_workers=5) as pool:
+        futures = [pool.submit(memo.call, KEY, fetch) for _ in range(5)]
+        time.sleep(0.1)
+        release.set()
+        results = [future.result() for future in futures]
+    assert len(calls) == 1
+    assert sorted(how for _, how in results) == [MISS] + [SHARED] * 4
+    assert {value for value, _ in results} == {"tasks"}
+    # ttl=0 coalesces in-flight calls but keeps nothing afterwards.
+    assert memo.call(KEY, lambda: "again") == ("again", MISS)
+
+def test_errors_reach_every_waiter_and_are_not_kept():
+    memo = Memo(ttl=60)
+    release = threading.Event()
+
+    def fetch():
+        release.wait(5)
+        raise RuntimeError("down")
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        futures = [pool.submit(memo.call, KEY, fetch) for _ in range(3)]
+        time.sleep(0.1)
+        release.set()
+        for future in futures:
+            with pytest.raises(RuntimeError):
+                future.result()
+    assert memo.call(KEY, lambda: "up") == ("up", MISS)
+
+def test_result_fetched_across_an_invalidation_is_not_kept():
+    memo = Memo(ttl=60)
+
+    def fetch():
+        memo.invalidate(["http://api/tasks"])
+        return "stale"
+    assert memo.call(KEY, fetch) == ("stale", MISS)
+    assert memo.call(KEY, lambda: "fresh") == ("fresh", MISS)
+
+def test_client_coalesces_identical_gets(server, client):
+    server.httpd.latency = 0.2
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        results = [*pool.map(lambda _: client.request("GET", "/tasks"), range(4))]
+    assert len(server.log) == 1
+    assert all(result is results[0] for result in results)
+    client.request("GET", "/tasks")
+    assert len(server.log) == 1
+
+def test_client_mutation_invalidates_the_collection(server, client):
+    client.request("GET", "/tasks")
+    client.request("POST", "/tasks/1/toggle", {"completed": True})
+    client.request("GET", "/tasks")
+    assert [(method, path) for method, path, _ in server.log] == [
+        ("GET", "/tasks"), ("POST", "/tasks/1/toggle"), ("GET", "/tasks")]
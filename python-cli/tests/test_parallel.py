@@ -0,0 +1,25 @@
+import json
+from fixtures import make_tasks
+from task_manager_cli.utils.parallel import TaskColumns, decode_json
+
+def decode(rows):
+    return decode_json(json.dumps(rows).encode("utf-8"), min_bytes=0, workers=2)
+
+def test_task_arrays_round_trip():
+    tasks = make_tasks(50)
+    tasks[7]["labels"] = ["home"]
+    decoded = decode(tasks)
+    assert isinstance(decoded, TaskColumns)
+    assert decoded.rows() == tasks
+
+def test_missing_keys_stay_missing():
+    tasks = [{"id": 1, "title": "Sparse", "completed": True}, {"id": 2, "title": "Bare", "status": "done", "note": "x"}]
+    decoded = decode(tasks)
+    assert isinstance(decoded, TaskColumns)
+    assert decoded.rows() == tasks
+
+def test_other_arrays_with_int_ids_are_left_alone():
+    users = [{"id": user_id, "username": f"user{user_id}"} for user_id in range(1, 20)]
+    categories = [{"id": category_id, "name": f"Category {category_id}"} for category_id in range(1, 20)]
+    assert decode(users) == users
+    assert decode(categories) == categories
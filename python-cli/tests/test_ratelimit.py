@@ -0,0 +1,76 @@
+import math
+import time
+from email.utils import formatdate
+import pytest
+from task_manager_cli.utils.api import APIError
+from task_manager_cli.utils.ratelimit import RateLimiter
+
+def test_rate_probes_past_the_starting_rate():
+    limiter = RateLimiter(rate=1, burst=2, increase=0.5)
+    for _ in range(10):
+        limiter.observe(200, {})
+    assert limiter.rate == 6
+    assert limiter.ceiling == math.inf
+
+def test_max_rate_is_the_ceiling():
+    limiter = RateLimiter(rate=1, burst=2, max_rate=2, increase=0.5)
+    for _ in range(10):
+        limiter.observe(200, {})
+    assert limiter.rate == 2
+
+def test_advertised_limit_is_the_ceiling():
+    limiter = RateLimiter(rate=1, burst=2, increase=1)
+    headers = {"X-RateLimit-Limit": "100", "X-RateLimit-Remaining": "100", "X-RateLimit-Reset": "20"}
+    for _ in range(10):
+        limiter.observe(200, headers)
+    assert limiter.ceiling == 5
+    assert limiter.rate == 5
+
+def test_429_halves_the_rate_and_blocks_for_retry_after():
+    limiter = RateLimiter(rate=4, burst=4)
+    limiter.observe(429, {}, retry_after=0.2)
+    assert limiter.rate == 2
+    start = time.monotonic()
+    limiter.acquire()
+    assert time.monotonic() - start >= 0.2
+
+def test_client_passes_retry_after_from_the_429_body(server, client):
+    client.limiter = RateLimiter(rate=100, burst=100)
+    server.script.append((429, {}, b'{"message": "Rate limit exceeded", "retryAfter": 30}'))
+    client.retry.retries = 0
+    with pytest.raises(APIError):
+        client.request("GET", "/tasks", memo=False)
+    assert client.limiter.blocked_until - time.monotonic() > 25
+
+def test_reset_as_http_date_is_ignored():
+    limiter = RateLimiter(rate=1, burst=1)
+    limiter.observe(200, {"X-RateLimit-Limit": "10", "X-RateLimit-Remaining": "1",
+                          "X-RateLimit-Reset": formatdate(usegmt=True)})
+    assert limiter.advertised_rate is None
+
+def test_unbounded_limiter_passes_requests_through():
+    limiter = RateLimiter(rate=None)
+    for _ in range(100):
+        assert limiter.acquire() == 0
+        limiter.observe(200, {})
+    assert limiter.rate is None
+
+def test_unbounded_limiter_starts_at_half_the_sent_rate_on_429():
+    limiter = RateLimiter(rate=None)
+    for _ in range(40):
+        limiter.acquire()
+    limiter.observe(429, {})
+    assert limiter.rate == 20
+    assert limiter.tokens == 0
+
+def test_unbounded_limiter_starts_at_the_advertised_budget():
+    limiter = RateLimiter(rate=None)
+    limiter.observe(200, {"X-RateLimit-Limit": "100", "X-RateLimit-Remaining": "10", "X-RateLimit-Reset": "20"})
+    assert limiter.rate == 0.5
+    assert limiter.tokens == 1
+
+def test_client_limiter_is_on_without_a_configured_rate(monkeypatch):
+    from task_manager_cli.utils.api import APIClient
+    monkeypatch.delenv("API_RATE_LIMIT", raising=False)
+    limiter = APIClient().limiter
+    assert limiter is not None and limiter.rate is None
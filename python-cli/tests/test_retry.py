@@ -0,0 +1,91 @@
+import time
+import pytest
+from task_manager_cli.utils.api import APIError
+from task_manager_cli.utils.retry import RetryPolicy, parse_retry_after
+
+UNAVAILABLE = (503, {}, b'{"message": "Service Unavailable"}')
+TOO_MANY = (429, {"Retry-After": "0"}, b'{"message": "Too many requests"}')
+
+def test_get_is_retried_on_transient_errors(server, client):
+    server.script.extend([UNAVAILABLE, UNAVAILABLE])
+    assert len(client.request("GET", "/tasks", memo=False)) == 3
+    assert len(server.log) == 3
+
+def test_attempts_are_bounded(server, client):
+    client.retry.retries = 2
+    server.script.extend([UNAVAILABLE] * 5)
+    with pytest.raises(APIError) as error:
+        client.request("GET", "/tasks", memo=False)
+    assert error.value.status_code == 503
+    assert len(server.log) == 3
+
+def test_client_errors_are_not_retried(server, client):
+    server.script.append((400, {}, b'{"message": "Bad request"}'))
+    with pytest.raises(APIError) as error:
+        client.request("GET", "/tasks", memo=False)
+    assert str(error.value) == "API error: Bad request"
+    assert len(server.log) == 1
+
+def test_post_is_not_retried_without_idempotency_key(server, client):
+    server.script.append(UNAVAILABLE)
+    with pytest.raises(APIError) as error:
+        client.request("POST", "/tasks/1/toggle", {"completed": True})
+    assert error.value.status_code == 503
+    assert len(server.log) == 1
+
+def test_post_with_idempotency_key_is_retried_with_the_same_key(server, client):
+    server.script.append(UNAVAILABLE)
+    client.request("POST", "/tasks/1/toggle", {"completed": True}, idempotency_key="key-1")
+    assert [headers.get("Idempotency-Key") for _, _, headers in server.log] == ["key-1", "key-1"]
+
+def test_post_is_retried_on_429(server, client):
+    # The rate limiter rejects a request before it is processed, so sending it again is safe.
+    server.script.append(TOO_MANY)
+    client.request("POST", "/tasks/1/toggle", {"completed": True})
+    assert len(server.log) == 2
+
+def test_retry_after_header_sets_the_delay(server, client):
+    server.script.append((429, {"Retry-After": "0.3"}, b"{}"))
+    start = time.monotonic()
+    client.request("GET", "/tasks", memo=False)
+    assert time.monotonic() - start >= 0.3
+
+def test_retry_after_body_field_sets_the_delay(server, client):
+    # The Hono backend sends the delay as `retryAfter` in the 429 body.
+    server.script.append((429, {}, b'{"message": "Rate limit exceeded", "retryAfter": 0.3}'))
+    start = time.monotonic()
+    client.request("GET", "/tasks", memo=False)
+    assert time.monotonic() - start >= 0.3
+
+def test_retry_budget_stops_retries(server, client):
+    client.retry.budget = 1
+    server.script.append((503, {"Retry-After": "5"}, b"{}"))
+    start = time.monotonic()
+    with pytest.raises(APIError):
+        client.request("GET", "/tasks", memo=False)
+    assert time.monotonic() - start < 1
+    assert len(server.log) == 1
+
+def test_policy_can_retry():
+    policy = RetryPolicy()
+    assert policy.can_retry("GET", False, 503)
+    assert policy.can_retry("PUT", False, None)
+    assert not policy.can_retry("POST", False, 503)
+    assert policy.can_retry("POST", True, 503)
+    assert policy.can_retry("POST", False, 429)
+
+def test_policy_delay():
+    policy = RetryPolicy(backoff=1, max_delay=4)
+    assert policy.delay(0, 429, 7.0) == 7.0
+    assert policy.delay(0, 503, 7.0) == 7.0
+    # Retry-After only counts for the statuses that define it; backoff is capped at max_delay.
+    assert all(0 <= policy.delay(5, 502, 7.0) <= 4 for _ in range(100))
+    assert all(0 <= policy.delay(1) <= 2 for _ in range(100))
+
+def test_parse_retry_after():
+    assert parse_retry_after("2") == 2.0
+    assert parse_retry_after("-1") == 0.0
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+    assert 55 < parse_retry_after(time.strftime("%a, %d %b %Y %H:%M:%S GMT", time.gmtime(time.time() + 60))) <= 60
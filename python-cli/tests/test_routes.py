@@ -0,0 +1,17 @@
+import time
+from task_manager_cli.utils.routes import MissingRoutes
+
+def test_missing_routes_persist_per_base_url(tmp_path):
+    path = str(tmp_path / "missing-routes.json")
+    MissingRoutes(path).add("http://a", "/tasks/overdue")
+    routes = MissingRoutes(path)
+    assert routes.missing("http://a", "/tasks/overdue")
+    assert not routes.missing("http://a", "/tasks/due/today")
+    assert not routes.missing("http://b", "/tasks/overdue")
+
+def test_missing_routes_expire(tmp_path, monkeypatch):
+    routes = MissingRoutes(str(tmp_path / "missing-routes.json"), ttl=60)
+    routes.add("http://a", "/tasks/overdue")
+    later = time.time() + 61
+    monkeypatch.setattr(time, "time", lambda: later)
+    assert not routes.missing("http://a", "/tasks/overdue")
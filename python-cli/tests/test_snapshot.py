@@ -0,0 +1,80 @@
+import os
+import pytest
+from task_manager_cli.utils.snapshot import Snapshot, write_snapshot
+
+def task(task_id, **fields):
+    row = {
+        "id": task_id,
+        "title": f"Task {task_id}",
+        "description": None,
+        "status": "pending",
+        "due_date": None,
+        "priority": "MEDIUM",
+        "completed": False,
+        "user_id": 1,
+        "category_id": None,
+        "created_at": "2024-01-01T00:00:00.000Z",
+        "updated_at": "2024-01-02T00:00:00.000Z",
+    }
+    row.update(fields)
+    return row
+
+ROWS = [
+    task(1, title="A", description=""),
+    task(2, title="Second task", description="x", due_date="2024-02-01T09:30:00.000Z", priority="HIGH"),
+    task(3, title="", description="", status="completed", completed=True, category_id=7),
+    task(4, title="Second task", description="Second task", created_at="", updated_at=""),
+    task(5, title="Ünïcode ✓", description="A", user_id=None),
+]
+
+def test_round_trip(tmp_path):
+    path = str(tmp_path / "snapshot.bin")
+    write_snapshot(path, ROWS)
+    snapshot = Snapshot.open(path)
+    try:
+        assert len(snapshot) == len(ROWS)
+        assert snapshot.rows() == ROWS
+        assert [snapshot.row(index) for index in range(len(ROWS))] == ROWS
+    finally:
+        snapshot.close()
+
+def test_row_after_rows_uses_same_texts(tmp_path):
+    # Both readers share one decoded-string cache; fill it from either side first.
+    path = str(tmp_path / "snapshot.bin")
+    write_snapshot(path, ROWS)
+    snapshot = Snapshot.open(path)
+    try:
+        assert [snapshot.row(index) for index in range(len(ROWS))] == ROWS
+        assert snapshot.rows() == ROWS
+    finally:
+        snapshot.close()
+
+def test_empty_snapshot(tmp_path):
+    path = str(tmp_path / "snapshot.bin")
+    write_snapshot(path, [])
+    snapshot = Snapshot.open(path)
+    try:
+        assert len(snapshot) == 0
+        assert snapshot.rows() == []
+    finally:
+        snapshot.close()
+
+def test_open_missing_or_foreign_file(tmp_path):
+    assert Snapshot.open(str(tmp_path / "missing.bin")) is None
+    other = tmp_path / "other.bin"
+    other.write_bytes(b"not a snapshot at all")
+    assert Snapshot.open(str(other)) is None
+
+def test_failed_write_leaves_no_temp_file(tmp_path, monkeypatch):
+    path = str(tmp_path / "snapshot.bin")
+    write_snapshot(path, ROWS)
+
+    def fail(fd):
+        raise OSError("No space left on device")
+    monkeypatch.setattr(os, "fsync", fail)
+    with pytest.raises(OSError):
+        write_snapshot(path, ROWS + [task(99)])
+    with pytest.raises(TypeError):
+        write_snapshot(path, [task("not-an-id")])
+    assert os.listdir(tmp_path) == ["snapshot.bin"]
+    assert len(Snapshot(path)) == len(ROWS)
@@ -0,0 +1,81 @@
+import json
+import pytest
+from fixtures import make_task
+from task_manager_cli.utils.store import TaskStore
+from task_manager_cli.utils.sync import SyncEngine
+
+def body(tasks):
+    return 200, {}, json.dumps(tasks).encode("utf-8")
+
+def stamped(task_id, updated_at):
+    return dict(make_task(task_id), updated_at=updated_at)
+
+@pytest.fixture
+def engine(client, tmp_path):
+    return SyncEngine(client, TaskStore(str(tmp_path / "store.sqlite3")), str(tmp_path / "snapshot.bin"),
+                      reconcile_interval=3600, max_age=60)
+
+def requests_sent(server):
+    return [path for _, path, _ in server.log]
+
+def test_rejected_filter_falls_back_to_the_full_list(server, engine):
+    assert engine.sync()["mode"] == "full"
+    # The mock server answers /tasks?updated_since=... with 404, like a backend without the filter.
+    stats = engine.sync()
+    assert stats["mode"] == "full" and stats["total"] == 3
+    assert requests_sent(server)[1].startswith("/tasks?updated_since=")
+    assert requests_sent(server)[2] == "/tasks"
+    engine.sync()
+    assert requests_sent(server)[3:] == ["/tasks"]
+
+def test_delta_with_other_precision_keeps_unchanged_tasks(server, engine):
+    server.script.append(body([stamped(1, "2024-01-01T00:00:00Z"), stamped(2, "2024-01-01T00:00:00Z")]))
+    engine.sync()
+    # Later than the watermark, but smaller as a string ("." sorts before "Z").
+    server.script.append(body([stamped(2, "2024-01-01T00:00:00.500Z")]))
+    stats = engine.sync()
+    assert (stats["mode"], stats["changed"], stats["removed"], stats["total"]) == ("delta", 1, 0, 2)
+    assert engine.store.get_meta("watermark") == "2024-01-01T00:00:00.500Z"
+    assert engine.store.get_meta("filter_supported", True)
+
+def test_ignored_filter_never_deletes(server, engine):
+    server.script.append(body([stamped(1, "2024-01-01T00:00:00Z"), stamped(2, "2024-01-02T00:00:00Z")]))
+    engine.sync()
+    # Task 1 is older than the watermark, so the server ignored updated_since; task 2 is missing.
+    server.script.append(body([stamped(1, "2024-01-01T00:00:00Z"), stamped(3, "2024-01-03T00:00:00Z")]))
+    stats = engine.sync()
+    assert (stats["mode"], stats["added"], stats["removed"], stats["total"]) == ("delta", 1, 0, 3)
+    assert engine.store.get_meta("filter_supported") is False
+    server.script.append(body([stamped(1, "2024-01-01T00:00:00Z"), stamped(3, "2024-01-03T00:00:00Z")]))
+    stats = engine.sync()
+    assert requests_sent(server)[-1] == "/tasks"
+    assert (stats["mode"], stats["removed"], stats["total"]) == ("full", 1, 2)
+
+def test_reads_sync_only_when_the_last_sync_is_old(server, engine):
+    assert engine.local_store() is None
+    engine.sync()
+    assert engine.local_store() is engine.store
+    assert len(server.log) == 1
+    last_sync = dict(engine.store.get_meta("last_sync"), synced_at="2024-01-01T00:00:00+00:00")
+    engine.store.apply(meta={"last_sync": last_sync})
+    engine.local_store()
+    assert len(server.log) > 1
+
+def test_completion_reads_states_from_the_store(tmp_path):
+    store = TaskStore(str(tmp_path / "store.sqlite3"))
+    store.apply([dict(make_task(task_id), completed=task_id % 2 == 0) for task_id in range(1, 1201)], [], {})
+    states = store.completion([*range(1, 1201), 9999])
+    assert len(states) == 1200 and 9999 not in states
+    assert states[2] and not states[1199]
+
+def test_mutations_show_up_in_local_reads(server, engine):
+    engine.sync()
+    engine.record(upserts=[make_task(10)], deletes=[1], patches={2: {"title": "Renamed"}})
+    rows = {row["id"]: row for row in engine.task_rows()}
+    assert sorted(rows) == [2, 3, 10]
+    assert rows[2]["title"] == "Renamed"
+    assert requests_sent(server) == ["/tasks"]
+
+def test_record_without_a_sync_creates_no_store(engine):
+    engine.record(deletes=[1])
+    assert not engine.store.exists()
@@ -0,0 +1,55 @@
+import math
+from task_manager_cli.models import Task
+from task_manager_cli.utils.urgency import DUE_CAP, UrgencyWeights, most_urgent, urgency
+
+NOW = 1_700_000_000.0  # 2023-11-14
+WEIGHTS = UrgencyWeights()
+
+def task(task_id, due=None, priority="MEDIUM", completed=False, created=None):
+    return Task({"id": task_id, "priority": priority, "completed": completed, "due_date": due, "created_at": created})
+
+def test_epoch_era_due_date_is_capped_not_overflowing():
+    # Decades overdue: 2 ** (days / 7) alone would overflow a float.
+    score = urgency(task(1, due="1970-01-01T00:00:00Z"), NOW, WEIGHTS)
+    assert math.isfinite(score)
+    assert score == WEIGHTS.priority * 0.5 + WEIGHTS.due * DUE_CAP
+
+def test_very_old_due_date():
+    score = urgency(task(1, due="0001-01-02T00:00:00Z"), NOW, WEIGHTS)
+    assert score == WEIGHTS.priority * 0.5 + WEIGHTS.due * DUE_CAP
+
+def test_due_pressure_grows_as_the_due_date_nears():
+    scores = [urgency(task(1, due=due), NOW, WEIGHTS)
+              for due in ("2024-06-01T00:00:00Z", "2023-11-21T00:00:00Z", "2023-11-14T00:00:00Z")]
+    assert scores == sorted(scores)
+    assert urgency(task(1), NOW, WEIGHTS) < scores[0]
+
+def test_age_is_capped():
+    old = urgency(task(1, created="2000-01-01T00:00:00Z"), NOW, WEIGHTS)
+    assert old == WEIGHTS.priority * 0.5 + WEIGHTS.age
+    future = urgency(task(1, created="2030-01-01T00:00:00Z"), NOW, WEIGHTS)
+    assert future == WEIGHTS.priority * 0.5
+
+def test_most_urgent_orders_highest_first_and_skips_completed():
+    tasks = [
+        task(1, priority="LOW"),
+        task(2, priority="HIGH"),
+        task(3, due="1970-01-01T00:00:00Z", completed=True),
+        task(4, due="2023-11-13T00:00:00Z"),
+        task(5, priority="MEDIUM"),
+    ]
+    ranked = most_urgent(tasks, 10, NOW, WEIGHTS)
+    assert [t.id for _, t in ranked] == [4, 2, 5, 1]
+    assert [score for score, _ in ranked] == sorted((score for score, _ in ranked), reverse=True)
+
+def test_most_urgent_is_bounded_by_count():
+    tasks = [task(i, due=f"2023-11-{i:02d}T00:00:00Z") for i in range(1, 29)]
+    ranked = most_urgent(iter(tasks), 3, NOW, WEIGHTS)
+    assert [t.id for _, t in ranked] == [1, 2, 3]
+    assert most_urgent(tasks, 0, NOW, WEIGHTS) == []
+    assert len(most_urgent(tasks, 100, NOW, WEIGHTS)) == len(tasks)
+
+def test_weights_apply():
+    due = task(1, due="2023-11-14T00:00:00Z", priority="HIGH")
+    assert urgency(due, NOW, UrgencyWeights(priority=0, due=0, age=0)) == 0
+    assert urgency(due, NOW, UrgencyWeights(priority=2, due=0, age=0)) == 2